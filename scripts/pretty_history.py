@@ -0,0 +1,26 @@
+#!/usr/bin/env python3
+"""Pretty-print the auto-updater's update history (compact JSONL on disk)."""
+
+import json
+import sys
+from pathlib import Path
+
+DEFAULT_HISTORY = Path("data/update_backups/update_history.jsonl")
+
+
+def main():
+    """Print each history entry as indented JSON, oldest first."""
+    history_file = Path(sys.argv[1]) if len(sys.argv) > 1 else DEFAULT_HISTORY
+
+    if not history_file.exists():
+        print(f"❌ No update history at {history_file}")
+        sys.exit(1)
+
+    with open(history_file) as f:
+        for line in f:
+            if line.strip():
+                print(json.dumps(json.loads(line), indent=2))
+
+
+if __name__ == "__main__":
+    main()
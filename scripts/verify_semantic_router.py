@@ -21,7 +21,6 @@ async def test_semantic_router():
     
     # Initialize router with test paths
     router = SemanticRouter(
-        db_path="data/chroma_test_semantic",
         golden_intents_path="data/golden_intents.json"
     )
     
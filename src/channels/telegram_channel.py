@@ -10,10 +10,77 @@ ALL intelligence is in ConversationManager - making it channel-agnostic.
 
 import asyncio
 import logging
-from typing import Optional, Dict, Any
+from dataclasses import dataclass
+from typing import Optional, Dict, Any, List, Tuple, Union
+
+import aiohttp
+import orjson
+
+from ..core.http_session import get_session
+from ..core.types import PartialReply
+from ..utils.ratelimit import TokenBucket
 
 logger = logging.getLogger(__name__)
 
+_API_BASE = "https://api.telegram.org"
+_API_TIMEOUT = aiohttp.ClientTimeout(total=10)
+
+_BATCH_WINDOW_SECONDS = 0.15  # Outbound messages this close together go out as one
+_MAX_MESSAGE_CHARS = 4096  # Telegram's sendMessage text limit
+_MAX_QUEUED_MESSAGES = 100  # Oldest queued message is dropped beyond this
+_FLUSH_TIMEOUT = 10  # Longest flush() waits for replies to go out
+
+# Legacy Markdown entities; text without these needs no server-side parsing
+_MARKDOWN_CHARS = frozenset("*_`[")
+
+_WEBHOOK_MAX_CONNECTIONS = 40  # Concurrent HTTPS connections Telegram may open to us
+
+_WORKER_COUNT = 8  # Inbound messages processed concurrently
+_MAX_PENDING_UPDATES = 256  # Inbound backlog; further updates are dropped
+
+# Telegram allows ~30 msg/s per bot; stay under it and honor 429 retry_after
+_SEND_RATE = 25
+_SEND_BURST = 30
+_MAX_429_RETRIES = 3
+_MAX_RETRY_AFTER = 60
+# Chat actions (typing indicator) aren't messages: they don't count toward
+# the send limit, so they skip the bucket instead of queueing behind replies
+_UNPACED_METHODS = frozenset({"sendChatAction"})
+
+
+class TelegramAPIError(Exception):
+    """Bot API call answered with ok=false (description holds Telegram's reason)."""
+
+
+@dataclass
+class TelegramUpdate:
+    """The parts of a Telegram update this channel acts on."""
+
+    chat_id: str
+    text: str = ""
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> Optional["TelegramUpdate"]:
+        """Extract chat id and text; None for updates without a chat message."""
+        try:
+            message = data["message"]
+            chat_id = message["chat"]["id"]
+            text = message.get("text") or ""
+        except (KeyError, TypeError, AttributeError):
+            return None
+        if not isinstance(chat_id, (int, str)) or not isinstance(text, str):
+            return None
+        return cls(chat_id=str(chat_id), text=text)
+
+    @classmethod
+    def from_json(cls, raw: bytes) -> Optional["TelegramUpdate"]:
+        """Decode a raw webhook body (orjson) and extract the update.
+
+        Raises:
+            orjson.JSONDecodeError: If the body isn't valid JSON
+        """
+        return cls.from_dict(orjson.loads(raw))
+
 
 class TelegramChannel:
     """Telegram channel adapter - thin transport layer only."""
@@ -38,18 +105,64 @@ class TelegramChannel:
         self.conversation_manager = conversation_manager
         self.webhook_url = webhook_url
         self.enabled = bool(bot_token and chat_id)
+        # Bot API calls go over the shared keep-alive session, not a client per call
+        self._api_base = f"{_API_BASE}/bot{bot_token}"
+        self._send_limiter = TokenBucket(rate=_SEND_RATE, burst=_SEND_BURST)
+
+        # Outbound batching: send_message() enqueues, _flush_loop() sends
+        self._send_queue: asyncio.Queue = asyncio.Queue(maxsize=_MAX_QUEUED_MESSAGES)
+        self._flush_task: Optional[asyncio.Task] = None
+
+        # Inbound worker pool: handle_webhook() enqueues, _worker() processes
+        self._msg_queue: asyncio.Queue = asyncio.Queue(maxsize=_MAX_PENDING_UPDATES)
+        self._workers: List[asyncio.Task] = []
+        # Set while no worker is between receiving a message and queueing its reply
+        self._busy_workers = 0
+        self._idle = asyncio.Event()
+        self._idle.set()
 
         if self.enabled:
-            try:
-                import telegram
-                self.bot = telegram.Bot(token=bot_token)
-                logger.info("Telegram channel initialized (thin wrapper)")
-            except ImportError:
-                logger.warning("python-telegram-bot not installed")
-                self.enabled = False
+            logger.info("Telegram channel initialized (thin wrapper)")
         else:
             logger.info("Telegram channel disabled")
 
+    async def _api(self, method: str, **payload) -> Any:
+        """Call a Telegram Bot API method.
+
+        Message calls are paced by a token bucket; a 429 is retried after
+        the retry_after Telegram reports instead of dropping the message.
+
+        Args:
+            method: Bot API method name (e.g. "sendMessage")
+            **payload: Method parameters (None values are omitted)
+
+        Returns:
+            The "result" field of the response
+
+        Raises:
+            TelegramAPIError: If Telegram answers ok=false
+        """
+        session = await get_session()
+        body = {k: v for k, v in payload.items() if v is not None}
+        for attempt in range(_MAX_429_RETRIES + 1):
+            if method not in _UNPACED_METHODS:
+                await self._send_limiter.acquire()
+            async with session.post(
+                f"{self._api_base}/{method}",
+                json=body,
+                timeout=_API_TIMEOUT,
+            ) as resp:
+                data = await resp.json(loads=orjson.loads, content_type=None)
+            if data.get("ok"):
+                return data.get("result")
+            retry_after = (data.get("parameters") or {}).get("retry_after")
+            if data.get("error_code") != 429 or retry_after is None or attempt >= _MAX_429_RETRIES:
+                break
+            delay = min(float(retry_after), _MAX_RETRY_AFTER)
+            logger.warning(f"Telegram rate limited on {method}, retrying in {delay:.0f}s")
+            await asyncio.sleep(delay)
+        raise TelegramAPIError(data.get("description", f"{method} failed ({resp.status})"))
+
     async def setup_webhook(self, secret_token: str = ""):
         """Set up webhook with Telegram.
 
@@ -62,12 +175,18 @@ class TelegramChannel:
             return False
 
         try:
-            kwargs = {"url": self.webhook_url}
+            kwargs = {
+                "url": self.webhook_url,
+                # Only plain messages are handled; don't get woken for edits,
+                # callback queries, etc. Keep Telegram's connection pool explicit.
+                "allowed_updates": ["message"],
+                "max_connections": _WEBHOOK_MAX_CONNECTIONS,
+            }
             if secret_token:
                 # Telegram only allows alphanumeric + _ and - in the secret token
                 safe_token = secret_token[:256]
                 kwargs["secret_token"] = safe_token
-            await self.bot.set_webhook(**kwargs)
+            await self._api("setWebhook", **kwargs)
             logger.info(f"✅ Telegram webhook set: {self.webhook_url}" + (" (with secret token)" if secret_token else ""))
 
             return True
@@ -76,24 +195,28 @@ class TelegramChannel:
             logger.error(f"Webhook setup failed: {e}")
             return False
 
-    async def handle_webhook(self, update_data: Dict[str, Any]) -> Dict[str, Any]:
+    async def handle_webhook(self, update_data: Union[bytes, Dict[str, Any]]) -> Dict[str, Any]:
         """Handle incoming webhook from Telegram.
 
         This is just routing - intelligence is in ConversationManager.
 
         Args:
-            update_data: Telegram update data
+            update_data: Raw webhook body (decoded here, straight into
+                TelegramUpdate) or an already-parsed update dict
 
         Returns:
             Response dict
         """
         try:
-            if "message" not in update_data:
+            if isinstance(update_data, (bytes, bytearray)):
+                update = TelegramUpdate.from_json(update_data)
+            else:
+                update = TelegramUpdate.from_dict(update_data)
+            if update is None:
                 return {"ok": True}
 
-            message = update_data["message"]
-            from_chat_id = str(message.get("chat", {}).get("id", ""))
-            text = message.get("text", "")
+            from_chat_id = update.chat_id
+            text = update.text
 
             # Verify authorized user
             if from_chat_id != self.chat_id:
@@ -105,8 +228,13 @@ class TelegramChannel:
 
             logger.info(f"Received: {text}")
 
-            # Process asynchronously
-            asyncio.create_task(self._process_and_respond(text, from_chat_id))
+            # Process asynchronously on the bounded worker pool
+            self._ensure_workers()
+            try:
+                self._msg_queue.put_nowait((text, from_chat_id))
+            except asyncio.QueueFull:
+                logger.warning("Telegram inbound queue full, dropping message")
+                return {"ok": True, "dropped": True}
 
             return {"ok": True}
 
@@ -117,32 +245,62 @@ class TelegramChannel:
     async def _process_and_respond(self, message: str, user_id: str):
         """Process message and send response with conversational updates.
 
+        Shows Telegram's typing indicator while working; a status message is
+        only sent once there is progress to report, then edited in place.
+
         Args:
             message: User message
             user_id: User ID
         """
         status_message = None
+        showing_reply = False  # Status message currently holds a streamed partial reply
+        # One sender applies updates in order; only the newest unsent update is
+        # kept, so stale partial replies never queue up behind a slow edit
+        pending_status: Optional[str] = None
+        status_task: Optional[asyncio.Task] = None
+        typing_task = asyncio.create_task(self._keep_typing())
         try:
-            # Send initial status
-            status_message = await self.bot.send_message(
-                chat_id=self.chat_id,
-                text="💭 Thinking...",
-                parse_mode="Markdown"
-            )
-
-            # Create progress callback for Telegram message editing
-            async def update_progress(status: str):
+            async def send_status(status: str):
                 """Update status message with conversational text (Telegram-specific rendering)."""
-                if status_message:
-                    try:
-                        await self.bot.edit_message_text(
+                nonlocal status_message, showing_reply
+                showing_reply = isinstance(status, PartialReply)
+                # Partial replies usually end mid-entity (an open * or `), which
+                # Telegram rejects; they go as plain text and the final edit
+                # applies Markdown
+                parse_mode = None if showing_reply else "Markdown"
+                try:
+                    if status_message is None:
+                        status_message = await self._api(
+                            "sendMessage",
+                            chat_id=self.chat_id,
+                            text=status,
+                            parse_mode=parse_mode
+                        )
+                    else:
+                        await self._api(
+                            "editMessageText",
                             chat_id=self.chat_id,
-                            message_id=status_message.message_id,
+                            message_id=status_message["message_id"],
                             text=status,
-                            parse_mode="Markdown"
+                            parse_mode=parse_mode
                         )
-                    except Exception as e:
-                        logger.debug(f"Status update skipped: {e}")
+                except Exception as e:
+                    logger.debug(f"Status update skipped: {e}")
+
+            async def drain_status():
+                """Send the newest pending update until none is left."""
+                nonlocal pending_status
+                while pending_status is not None:
+                    status, pending_status = pending_status, None
+                    await send_status(status)
+
+            # Create progress callback for Telegram message editing. Progress is
+            # fire-and-forget so the caller's work doesn't wait on a round-trip.
+            async def update_progress(status: str):
+                nonlocal pending_status, status_task
+                pending_status = status  # Replaces an update not yet sent
+                if status_task is None or status_task.done():
+                    status_task = asyncio.create_task(drain_status())
 
             # CORE INTELLIGENCE HERE (channel-agnostic)
             # ConversationManager handles periodic updates internally for ALL operations
@@ -155,53 +313,204 @@ class TelegramChannel:
                 enable_periodic_updates=True  # Telegram: message editing = non-spammy
             )
 
-            # Delete status message
-            try:
-                await self.bot.delete_message(
-                    chat_id=self.chat_id,
-                    message_id=status_message.message_id
-                )
-            except:
-                pass
+            typing_task.cancel()
+            # Drop unsent updates and let the in-flight one land so the message
+            # can be edited or deleted
+            pending_status = None
+            if status_task:
+                await asyncio.gather(status_task, return_exceptions=True)
+
+            # A streamed reply is finished in place rather than replaced
+            if showing_reply and status_message and await self._edit_text(
+                status_message["message_id"], response
+            ):
+                return
+            await self._delete_status(status_message)
 
             # Send final response
             await self.send_message(response)
 
         except Exception as e:
-            logger.error(f"Process error: {e}", exc_info=True)
+            # Bot API/network failures are expected; only log a traceback for bugs
+            expected = isinstance(e, (TelegramAPIError, aiohttp.ClientError, asyncio.TimeoutError))
+            logger.error(f"Process error: {e}", exc_info=not expected)
             # Try to clean up status message
-            if status_message:
-                try:
-                    await self.bot.delete_message(
-                        chat_id=self.chat_id,
-                        message_id=status_message.message_id
-                    )
-                except:
-                    pass
-            await self.send_message(f"❌ Error: {str(e)}")
+            pending_status = None
+            if status_task:
+                await asyncio.gather(status_task, return_exceptions=True)
+            await self._delete_status(status_message)
+            await self.send_message(f"❌ Error: {str(e)}", parse_mode=None)
+        finally:
+            typing_task.cancel()
+
+    async def _keep_typing(self):
+        """Show the typing indicator until cancelled (Telegram expires it after ~5s)."""
+        while True:
+            try:
+                await self._api("sendChatAction", chat_id=self.chat_id, action="typing")
+            except Exception as e:
+                logger.debug(f"Typing indicator skipped: {e}")
+            await asyncio.sleep(4)
+
+    async def _delete_status(self, status_message: Optional[Dict[str, Any]]):
+        """Delete the progress status message, if one was sent."""
+        if not status_message:
+            return
+        try:
+            await self._api(
+                "deleteMessage",
+                chat_id=self.chat_id,
+                message_id=status_message["message_id"]
+            )
+        except Exception:
+            pass
 
-    async def send_message(self, text: str):
-        """Send message to Telegram.
+    async def _edit_text(self, message_id: int, text: str) -> bool:
+        """Replace a sent message's text, falling back to plain text if Markdown is rejected.
+
+        Returns:
+            True if the message now shows text
+        """
+        if len(text) > _MAX_MESSAGE_CHARS:
+            return False
+        parse_mode = None if _MARKDOWN_CHARS.isdisjoint(text) else "Markdown"
+        try:
+            await self._api(
+                "editMessageText",
+                chat_id=self.chat_id,
+                message_id=message_id,
+                text=text,
+                parse_mode=parse_mode
+            )
+            return True
+        except Exception as e:
+            if parse_mode and ("parse" in str(e).lower() or "entities" in str(e).lower()):
+                try:
+                    await self._api("editMessageText", chat_id=self.chat_id, message_id=message_id, text=text)
+                    return True
+                except Exception as e2:
+                    e = e2
+            # Unchanged text means the partial reply already matched the final one
+            if "not modified" in str(e).lower():
+                return True
+            logger.debug(f"Final reply edit failed, sending instead: {e}")
+            return False
 
-        This is just transport - no intelligence here.
+    def _ensure_workers(self):
+        """Start (or restart) the inbound worker pool on first use."""
+        self._workers = [w for w in self._workers if not w.done()]
+        for _ in range(_WORKER_COUNT - len(self._workers)):
+            self._workers.append(asyncio.create_task(self._worker()))
+
+    async def _worker(self):
+        """Process queued inbound messages one at a time."""
+        while True:
+            text, chat_id = await self._msg_queue.get()
+            self._busy_workers += 1
+            self._idle.clear()
+            try:
+                await self._process_and_respond(text, chat_id)
+            except Exception as e:
+                logger.error(f"Telegram worker error: {e}", exc_info=True)
+            finally:
+                self._busy_workers -= 1
+                if not self._busy_workers:
+                    self._idle.set()
+                self._msg_queue.task_done()
+
+    async def send_message(self, text: str, parse_mode: Optional[str] = "Markdown"):
+        """Queue a message for Telegram.
+
+        This is just transport - no intelligence here. Messages queued within
+        a short window are combined into one sendMessage call. Text without
+        any Markdown markup is sent without parse_mode.
 
         Args:
             text: Message to send
+            parse_mode: Telegram parse mode, or None for plain text (use for
+                arbitrary content such as error strings or log output)
         """
         if not self.enabled:
             return
 
+        if parse_mode == "Markdown" and _MARKDOWN_CHARS.isdisjoint(text):
+            parse_mode = None
+
+        if self._send_queue.full():
+            self._send_queue.get_nowait()
+            self._send_queue.task_done()
+            logger.warning("Telegram send queue full, dropped oldest message")
+        self._send_queue.put_nowait((text, parse_mode))
+
+        if self._flush_task is None or self._flush_task.done():
+            self._flush_task = asyncio.create_task(self._flush_loop())
+
+    async def _flush_loop(self):
+        """Drain the send queue, combining messages that arrive within the batch window."""
+        loop = asyncio.get_running_loop()
+        carry: Optional[Tuple[str, Optional[str]]] = None
+        while True:
+            first, parse_mode = carry if carry is not None else await self._send_queue.get()
+            carry = None
+            batch = [first]
+            size = len(first)
+            # Plain-mode text containing markup can't join a Markdown message
+            raw = parse_mode is None and not _MARKDOWN_CHARS.isdisjoint(first)
+            deadline = loop.time() + _BATCH_WINDOW_SECONDS
+
+            while size < _MAX_MESSAGE_CHARS:
+                remaining = deadline - loop.time()
+                if remaining <= 0:
+                    break
+                try:
+                    text, mode = await asyncio.wait_for(self._send_queue.get(), remaining)
+                except asyncio.TimeoutError:
+                    break
+                text_raw = mode is None and not _MARKDOWN_CHARS.isdisjoint(text)
+                merged_mode = parse_mode or mode
+                if size + 2 + len(text) > _MAX_MESSAGE_CHARS or (merged_mode and (raw or text_raw)):
+                    carry = (text, mode)  # Doesn't fit — starts the next batch
+                    break
+                batch.append(text)
+                size += 2 + len(text)
+                parse_mode = merged_mode
+                raw = raw or text_raw
+
+            try:
+                await self._send_text("\n\n".join(batch), parse_mode)
+            finally:
+                for _ in batch:
+                    self._send_queue.task_done()
+
+    async def flush(self, timeout: float = _FLUSH_TIMEOUT):
+        """Wait (up to timeout seconds) for in-progress replies to be sent.
+
+        Covers messages still being processed (their replies aren't queued
+        yet) as well as the outbound queue and the batch being sent.
+        """
+        async def drained():
+            await self._idle.wait()
+            await self._send_queue.join()
+
+        try:
+            await asyncio.wait_for(drained(), timeout)
+        except asyncio.TimeoutError:
+            logger.warning(f"Telegram replies not drained ({self._send_queue.qsize()} queued)")
+
+    async def _send_text(self, text: str, parse_mode: Optional[str] = "Markdown"):
+        """Send one message, falling back to plain text if Markdown is rejected."""
         try:
-            await self.bot.send_message(
+            await self._api(
+                "sendMessage",
                 chat_id=self.chat_id,
                 text=text,
-                parse_mode="Markdown"
+                parse_mode=parse_mode
             )
         except Exception as e:
-            if "parse" in str(e).lower() or "entities" in str(e).lower():
+            if parse_mode and ("parse" in str(e).lower() or "entities" in str(e).lower()):
                 # Markdown parsing failed — retry as plain text so message is never lost
                 try:
-                    await self.bot.send_message(chat_id=self.chat_id, text=text)
+                    await self._api("sendMessage", chat_id=self.chat_id, text=text)
                     logger.debug("Sent as plain text (Markdown parse failed)")
                 except Exception as e2:
                     logger.error(f"Send failed (plain text fallback): {e2}")
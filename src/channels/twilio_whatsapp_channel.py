@@ -37,6 +37,8 @@ class TwilioWhatsAppChannel:
         self.whatsapp_number = whatsapp_number
         self.conversation_manager = conversation_manager
         self.allowed_numbers = allowed_numbers or []
+        # Normalized once here instead of on every incoming message
+        self._allowed_set = frozenset(num.replace('whatsapp:', '') for num in self.allowed_numbers)
         
         self.enabled = bool(account_sid and auth_token and whatsapp_number)
         
@@ -59,8 +61,7 @@ class TwilioWhatsAppChannel:
 
         # Strip 'whatsapp:' for checking against allowed list
         clean_number = phone_number.replace('whatsapp:', '')
-        clean_allowed = [num.replace('whatsapp:', '') for num in self.allowed_numbers]
-        return clean_number in clean_allowed
+        return clean_number in self._allowed_set
 
     async def handle_webhook(self, form_data: Dict[str, str]) -> str:
         """Handle incoming Twilio WhatsApp webhook (/twilio/whatsapp).
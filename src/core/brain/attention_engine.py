@@ -22,6 +22,7 @@ from pathlib import Path
 from typing import Optional
 
 from ..timezone import now as tz_now
+from ...utils.llm_json import parse_llm_json
 from .nova_purpose import NovaPurpose, PurposeMode
 
 logger = logging.getLogger(__name__)
@@ -280,9 +281,8 @@ class AttentionEngine:
                     max_tokens=256,
                 )
                 text = resp.content[0].text.strip()
-                # Strip markdown fences if present
-                text = text.replace("```json", "").replace("```", "").strip()
-                result = json.loads(text)
+                # Tolerates markdown fences and prose around the JSON
+                result = parse_llm_json(text)
                 if not isinstance(result, list):
                     continue
                 # Sanitize each observation before returning
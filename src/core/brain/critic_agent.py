@@ -20,6 +20,8 @@ import logging
 from dataclasses import dataclass, field
 from typing import List, Optional
 
+from ...utils.llm_json import parse_llm_json
+
 logger = logging.getLogger(__name__)
 
 _CRITIC_PROMPT = """You are a quality critic for an AI agent's task output.
@@ -305,15 +307,9 @@ class CriticAgent:
 
     def _parse_critic_response(self, text: str) -> CriticResult:
         """Parse the JSON critic response into a CriticResult."""
-        text = text.strip()
-        # Strip markdown fences if present
-        if text.startswith("```"):
-            lines = text.split("\n")
-            text = "\n".join(lines[1:-1] if lines[-1].strip() == "```" else lines[1:])
-        text = text.strip()
-
         try:
-            data = json.loads(text)
+            # Tolerates markdown fences and prose around the JSON
+            data = parse_llm_json(text)
             score = float(data.get("score", 0.5))
             passed = bool(data.get("passed", score >= self.PASS_THRESHOLD))
             # Override passed based on threshold to be consistent
@@ -20,7 +20,7 @@ import logging
 from collections import defaultdict
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, List, Optional, Tuple
 
 logger = logging.getLogger(__name__)
 
@@ -62,6 +62,9 @@ class IntentDataCollector:
         self._output = Path(output_path)
         self._golden = Path(golden_path)
         self._min_confidence = min_confidence
+        # (mtime_ns, size) of the dataset -> formatted stats, so repeated
+        # status requests don't re-parse an unchanged file
+        self._stats_cache: Optional[Tuple[Tuple[int, int], str]] = None
 
         self._output.parent.mkdir(parents=True, exist_ok=True)
 
@@ -124,11 +127,27 @@ class IntentDataCollector:
         """Return label distribution and total count as a formatted string.
 
         Output is Telegram Markdown compatible and suitable for embedding in
-        the status reply from _handle_status().
+        the status reply from _handle_status(). The result is cached until
+        the dataset file changes.
 
         Returns:
             Multi-line string with label counts and percentages.
         """
+        try:
+            st = self._output.stat()
+            key = (st.st_mtime_ns, st.st_size)
+        except OSError:
+            key = None
+        if key is not None and self._stats_cache and self._stats_cache[0] == key:
+            return self._stats_cache[1]
+
+        stats = self._compute_stats()
+        if key is not None:
+            self._stats_cache = (key, stats)
+        return stats
+
+    def _compute_stats(self) -> str:
+        """Parse the dataset and format label counts (uncached)."""
         try:
             counts: Dict[str, int] = defaultdict(int)
             golden_count = 0
@@ -0,0 +1,133 @@
+"""SQLite persistence for the intent and chat-reply caches.
+
+The caches themselves live in memory (ConversationManager's intent LRU and
+the per-user SemanticCache); this store only mirrors their entries to disk
+so a restart (e.g. after a git update) comes back warm instead of sending
+every first message to the LLM again. Rows past the caller's TTL are
+skipped on load and pruned on write.
+"""
+
+import json
+import logging
+import sqlite3
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Dict, List, Tuple
+
+logger = logging.getLogger(__name__)
+
+
+class ResponseCacheStore:
+    """SQLite-backed mirror of the in-memory response caches.
+
+    Each operation opens its own short-lived connection (same pattern as
+    TaskQueue), so calls are safe from worker threads.
+    """
+
+    def __init__(self, data_dir: str = "./data"):
+        self.db_path = Path(data_dir) / "nova_cache.db"
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self._init_db()
+        logger.info(f"ResponseCacheStore initialized at {self.db_path}")
+
+    @contextmanager
+    def _conn(self):
+        """Yield a short-lived SQLite connection with WAL mode for concurrency."""
+        conn = sqlite3.connect(str(self.db_path), timeout=10)
+        conn.execute("PRAGMA journal_mode=WAL")
+        try:
+            yield conn
+            conn.commit()
+        except Exception:
+            conn.rollback()
+            raise
+        finally:
+            conn.close()
+
+    def _init_db(self):
+        """Create tables if they don't exist."""
+        with self._conn() as conn:
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS intent_cache (
+                    message TEXT NOT NULL,
+                    context TEXT NOT NULL,
+                    intent_json TEXT NOT NULL,
+                    ts REAL NOT NULL,
+                    PRIMARY KEY (message, context)
+                )
+            """)
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS chat_cache (
+                    user_id TEXT NOT NULL,
+                    embedding BLOB NOT NULL,
+                    context TEXT NOT NULL,
+                    reply TEXT NOT NULL,
+                    ts REAL NOT NULL
+                )
+            """)
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_intent_ts ON intent_cache(ts)")
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_chat_user_ts ON chat_cache(user_id, ts)")
+
+    # ── Intent cache ─────────────────────────────────────────────────────────
+
+    def load_intents(self, max_age: float, limit: int) -> List[Tuple[str, str, float, Dict[str, Any]]]:
+        """Return fresh intents, oldest first, as (message, context, age_seconds, intent)."""
+        now = time.time()
+        with self._conn() as conn:
+            rows = conn.execute(
+                """SELECT message, context, intent_json, ts FROM intent_cache
+                   WHERE ts >= ? ORDER BY ts DESC LIMIT ?""",
+                (now - max_age, limit),
+            ).fetchall()
+        return [
+            (message, context, now - ts, json.loads(intent_json))
+            for message, context, intent_json, ts in reversed(rows)
+        ]
+
+    def put_intent(self, message: str, context: str, intent: Dict[str, Any], max_age: float):
+        """Store an intent and drop rows older than max_age."""
+        now = time.time()
+        try:
+            with self._conn() as conn:
+                conn.execute(
+                    "INSERT OR REPLACE INTO intent_cache VALUES (?, ?, ?, ?)",
+                    (message, context, json.dumps(intent, default=str), now),
+                )
+                conn.execute("DELETE FROM intent_cache WHERE ts < ?", (now - max_age,))
+        except Exception as e:
+            logger.debug(f"Intent cache write skipped: {e}")
+
+    # ── Chat reply cache ─────────────────────────────────────────────────────
+
+    def load_chat(self, user_id: str, max_age: float, limit: int) -> List[Tuple[float, bytes, str, str]]:
+        """Return a user's fresh replies, oldest first, as (age_seconds, embedding bytes, context, reply)."""
+        now = time.time()
+        with self._conn() as conn:
+            rows = conn.execute(
+                """SELECT embedding, context, reply, ts FROM chat_cache
+                   WHERE user_id = ? AND ts >= ? ORDER BY ts DESC LIMIT ?""",
+                (user_id, now - max_age, limit),
+            ).fetchall()
+        return [(now - ts, embedding, context, reply) for embedding, context, reply, ts in reversed(rows)]
+
+    def put_chat(self, user_id: str, embedding: bytes, context: str, reply: str, max_age: float):
+        """Store a chat reply with its context digest and drop rows older than max_age.
+
+        Args:
+            user_id: Owner of the per-user cache
+            embedding: float32 message embedding bytes
+            context: Digest of the prompt context the reply was generated under
+            reply: Reply text
+            max_age: TTL in seconds; older rows are pruned
+        """
+        now = time.time()
+        try:
+            with self._conn() as conn:
+                conn.execute(
+                    "INSERT INTO chat_cache VALUES (?, ?, ?, ?, ?)",
+                    (user_id, embedding, context, reply, now),
+                )
+                conn.execute("DELETE FROM chat_cache WHERE ts < ?", (now - max_age,))
+        except Exception as e:
+            logger.debug(f"Chat cache write skipped: {e}")
@@ -9,12 +9,13 @@ Both use Gemini Flash with tight timeouts. Fail-open on all errors.
 """
 
 import asyncio
-import json
 import logging
 import re
 from dataclasses import dataclass, field
 from typing import Any, Dict, List, Optional
 
+from ...utils.llm_json import parse_llm_json
+
 logger = logging.getLogger(__name__)
 
 
@@ -88,10 +89,8 @@ class SelfAssessor:
             elif isinstance(resp, dict):
                 text = resp.get("text", "").strip()
 
-            # Strip markdown fences
-            text = text.replace("```json", "").replace("```", "").strip()
-
-            data = json.loads(text)
+            # Tolerates markdown fences and prose around the JSON
+            data = parse_llm_json(text)
             return SelfAssessment(
                 confidence=data.get("confidence", "high"),
                 weak_areas=data.get("weak_areas", [])[:2],
@@ -0,0 +1,103 @@
+"""Semantic response cache: reuse a reply for a near-identical recent message.
+
+Embeddings live in one preallocated float32 matrix (a ring buffer), so a
+lookup is a single matmul against every cached row. Each entry also carries
+a digest of the prompt context the reply was generated under, and only
+entries with the caller's current digest can hit. Entries expire after a
+short TTL as well, since brain context drifts between messages.
+"""
+
+import asyncio
+import logging
+import time
+from typing import List, Optional, Tuple
+
+import numpy as np
+
+from .semantic_router import embed_message
+
+logger = logging.getLogger(__name__)
+
+
+class SemanticCache:
+    """Fixed-size cache of (message embedding, context digest, reply) entries."""
+
+    def __init__(
+        self,
+        capacity: int = 256,
+        dim: int = 384,
+        threshold: float = 0.95,
+        ttl: float = 900.0,
+    ):
+        """Initialize the cache.
+
+        Args:
+            capacity: Max entries; the oldest is overwritten when full
+            dim: Embedding dimension (all-MiniLM-L6-v2 = 384)
+            threshold: Minimum cosine similarity for a hit
+            ttl: Seconds an entry stays valid
+        """
+        self.capacity = capacity
+        self.threshold = threshold
+        self.ttl = ttl
+        self._vectors = np.zeros((capacity, dim), dtype=np.float32)
+        self._stored_at = np.full(capacity, -np.inf)
+        self._replies: List[Optional[str]] = [None] * capacity
+        self._contexts: List[Optional[str]] = [None] * capacity
+        self._next = 0  # Ring-buffer write position
+
+    async def embed(self, message: str) -> np.ndarray:
+        """Embed a message (unit-normalized) off the event loop."""
+        return await asyncio.to_thread(embed_message, message)
+
+    def lookup(self, vector: np.ndarray, context: str = "") -> Optional[str]:
+        """Return the cached reply for the most similar fresh entry, if any.
+
+        Args:
+            vector: Unit-normalized message embedding
+            context: Digest of the current prompt context; only entries
+                     stored under the same digest are considered
+        """
+        sims = self._vectors @ vector
+        sims[self._stored_at < time.monotonic() - self.ttl] = -1.0
+        sims[[c != context for c in self._contexts]] = -1.0
+        best = int(np.argmax(sims))
+        if sims[best] < self.threshold:
+            return None
+        logger.debug(f"Semantic cache hit (sim {sims[best]:.3f})")
+        return self._replies[best]
+
+    def add(
+        self,
+        vector: np.ndarray,
+        reply: str,
+        context: str = "",
+        stored_at: Optional[float] = None,
+    ):
+        """Insert a reply, overwriting the oldest entry when full.
+
+        Args:
+            vector: Unit-normalized message embedding
+            reply: Reply to serve on a hit
+            context: Digest of the prompt context the reply was generated under
+            stored_at: time.monotonic() the entry was created (default now)
+        """
+        i = self._next
+        self._vectors[i] = vector
+        self._stored_at[i] = time.monotonic() if stored_at is None else stored_at
+        self._replies[i] = reply
+        self._contexts[i] = context
+        self._next = (i + 1) % len(self._replies)
+
+    def restore(self, entries: List[Tuple[float, bytes, str, str]]):
+        """Re-insert persisted entries given as (age_seconds, float32 embedding bytes, context, reply).
+
+        The stored context digest is kept, so a restored reply only hits
+        under the same prompt context it was generated with.
+        """
+        now = time.monotonic()
+        for age, blob, context, reply in entries:
+            vector = np.frombuffer(blob, dtype=np.float32)
+            if vector.shape != self._vectors.shape[1:]:
+                continue  # Stored with a different embedding model
+            self.add(vector, reply, context, stored_at=now - age)
@@ -1,98 +1,92 @@
 """Semantic Router for fast intent classification via vector similarity.
 
-Uses ChromaDB to match user messages against "golden examples" of intents.
-If a high-confidence match is found (>0.90), it bypasses the LLM.
+Matches user messages against in-memory embeddings of "golden examples" of
+intents. If a high-confidence match is found (>0.90), it bypasses the LLM.
 """
 
 import json
 import logging
 import asyncio
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, Any, Optional, List, Tuple
-from .vector_db import VectorDatabase
+from typing import Dict, Any, Optional, List
+
+import numpy as np
+
+from .vector_db import get_embedding_model
 
 logger = logging.getLogger(__name__)
 
+_EMBEDDING_MODEL = "all-MiniLM-L6-v2"
+
+
+@lru_cache(maxsize=512)
+def embed_message(text: str) -> np.ndarray:
+    """Embed one message (unit-normalized); repeated messages hit the cache."""
+    return get_embedding_model(_EMBEDDING_MODEL).encode(text, normalize_embeddings=True)
+
 
 class SemanticRouter:
     """Fast-path intent classifier using vector similarity."""
 
     def __init__(
         self,
-        db_path: str = "data/lancedb_semantic",
         golden_intents_path: str = "data/golden_intents.json",
         threshold: float = 0.90
     ):
         """Initialize Semantic Router.
 
         Args:
-            db_path: Path to store ChromaDB collection
             golden_intents_path: Path to JSON file with golden examples
             threshold: Similarity threshold (0.0-1.0) for a match.
                        >0.90 is recommended for "lock" certainty.
         """
-        self.db = VectorDatabase(
-            path=db_path,
-            collection_name="semantic_intents",
-            embedding_model="all-MiniLM-L6-v2"
-        )
         self.golden_intents_path = Path(golden_intents_path)
         self.threshold = threshold
         self._initialized = False
 
+        # One row per golden example (unit vectors) + its metadata
+        self._matrix: Optional[np.ndarray] = None
+        self._examples: List[Dict[str, Any]] = []
+
     async def initialize(self):
-        """Load golden examples into ChromaDB if needed."""
+        """Embed the golden examples into an in-memory matrix."""
         if self._initialized:
             return
 
         try:
-            # Check if we need to populate/update
-            # For simplicity, we'll reload if the collection is empty.
-            # IN A PRODUCTION SYSTEM: You'd check hash/version of the JSON file.
-            count = self.db.count()
-            if count == 0:
-                await self._populate_db()
-            else:
-                logger.info(f"Semantic Router ready ({count} examples loaded)")
-            
+            await self._load_examples()
             self._initialized = True
         except Exception as e:
             logger.error(f"Failed to initialize Semantic Router: {e}")
 
-    async def _populate_db(self):
-        """Read JSON and embed all examples."""
+    async def _load_examples(self):
+        """Read JSON and embed all examples in one batch."""
         if not self.golden_intents_path.exists():
             logger.warning(f"Golden intents file not found: {self.golden_intents_path}")
             return
 
-        try:
-            with open(self.golden_intents_path, 'r') as f:
-                intents_data = json.load(f)
-
-            logger.info(f"Loading {len(intents_data)} intent groups into Semantic Router...")
-
-            count = 0
-            for group in intents_data:
-                intent_name = group.get("intent")
-                examples = group.get("examples", [])
-                tools = group.get("tools", [])
-
-                for phrase in examples:
-                    # Store phrase with metadata about intent & tools
-                    await self.db.store(
-                        text=phrase,
-                        metadata={
-                            "intent": intent_name,
-                            "tools": ",".join(tools),
-                            "is_golden": True
-                        }
-                    )
-                    count += 1
-            
-            logger.info(f"Successfully embedded {count} golden examples")
+        with open(self.golden_intents_path, 'r') as f:
+            intents_data = json.load(f)
 
-        except Exception as e:
-            logger.error(f"Error populating Semantic Router DB: {e}")
+        phrases = []
+        examples = []
+        for group in intents_data:
+            intent_name = group.get("intent")
+            tools = group.get("tools", [])
+            for phrase in group.get("examples", []):
+                phrases.append(phrase)
+                examples.append({"text": phrase, "intent": intent_name, "tools": tools})
+
+        if not phrases:
+            return
+
+        model = get_embedding_model(_EMBEDDING_MODEL)
+        self._matrix = await asyncio.to_thread(
+            model.encode, phrases, normalize_embeddings=True, convert_to_numpy=True
+        )
+        self._examples = examples
+        logger.info(f"Semantic Router ready ({len(examples)} examples from {len(intents_data)} intent groups)")
 
     async def route(self, message: str) -> Optional[Dict[str, Any]]:
         """Route a message to an intent if similarity is high enough.
@@ -111,40 +105,30 @@ class SemanticRouter:
         """
         if not self._initialized:
             await self.initialize()
+        if self._matrix is None:
+            return None
 
         try:
-            # Search for closest match
-            results = await self.db.search(message, n_results=1)
-            
-            if not results:
-                return None
+            vector = await asyncio.to_thread(embed_message, message)
+
+            # Unit vectors: one matmul gives cosine similarity to every example
+            scores = self._matrix @ vector
+            best = int(np.argmax(scores))
+            best_match = self._examples[best]
 
-            best_match = results[0]
-            distance = best_match.get("distance", 1.0)
-            
-            # Chroma returns DISTANCE (lower is better).
-            # Cosine distance: 0.0 = identical, 1.0 = opposite.
-            # Roughly: Similarity = 1 - distance (for normalized embeddings)
-            # But Chroma's default distance metric might be L2 or Cosine. 
-            # all-MiniLM-L6-v2 usually works well with < 0.2 distance for "very close".
-            # Let's assume similarity = 1 - distance for now, treating distance < 0.1 as > 0.9 match.
-            
-            # Use distance threshold directly.
-            # Distance < (1 - self.threshold)
+            # Squared L2 distance between unit vectors (2 - 2cos), which is what
+            # LanceDB's default metric reported, so the threshold keeps its meaning
+            distance = max(0.0, 2.0 - 2.0 * float(scores[best]))
             match_threshold = 1.0 - self.threshold
-            
+
             if distance <= match_threshold:
-                metadata = best_match.get("metadata", {})
-                intent = metadata.get("intent")
-                tools_str = metadata.get("tools", "")
-                tools = [t for t in tools_str.split(",") if t]
-                
+                intent = best_match["intent"]
                 logger.info(f"🎯 Semantic Router HIT: '{message}' matched '{best_match['text']}' (dist: {distance:.4f}) -> {intent}")
-                
+
                 return {
                     "action": intent,
-                    "confidence": 1.0 - distance, # approximation
-                    "tool_hints": tools,
+                    "confidence": 1.0 - distance,  # approximation
+                    "tool_hints": list(best_match["tools"]),
                     "source": "semantic_router",
                     "parameters": {}
                 }
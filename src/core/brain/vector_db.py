@@ -23,7 +23,7 @@ logger = logging.getLogger(__name__)
 _embedding_model: Optional[SentenceTransformer] = None
 
 
-def _get_embedding_model(model_name: str = "all-MiniLM-L6-v2") -> SentenceTransformer:
+def get_embedding_model(model_name: str = "all-MiniLM-L6-v2") -> SentenceTransformer:
     """Lazy-load and cache the embedding model."""
     global _embedding_model
     if _embedding_model is None:
@@ -62,7 +62,7 @@ class VectorDatabase:
 
         # Connect to LanceDB
         self.db = lancedb.connect(path)
-        self.model = _get_embedding_model(embedding_model)
+        self.model = get_embedding_model(embedding_model)
         self._dim = self.model.get_sentence_embedding_dimension()
 
         # Open or create table
@@ -125,7 +125,7 @@ class VectorDatabase:
         # Deduplication: check for near-duplicates before storing
         if deduplicate:
             try:
-                loop = asyncio.get_event_loop()
+                loop = asyncio.get_running_loop()
                 existing = await loop.run_in_executor(
                     None, lambda: self._find_similar(vector, dedup_threshold)
                 )
@@ -149,7 +149,7 @@ class VectorDatabase:
             "vector": vector,
         }
 
-        loop = asyncio.get_event_loop()
+        loop = asyncio.get_running_loop()
         try:
             await loop.run_in_executor(None, lambda: self._upsert(record, doc_id))
         except Exception as e:
@@ -238,7 +238,7 @@ class VectorDatabase:
         Returns:
             List of matching documents with metadata and distances
         """
-        loop = asyncio.get_event_loop()
+        loop = asyncio.get_running_loop()
         # Fetch extra candidates when composite scoring (re-ranking needs a wider pool)
         fetch_n = n_results * 3 if composite_scoring else n_results
 
@@ -393,7 +393,7 @@ class VectorDatabase:
         Returns:
             Number of records forgotten (or would be, if dry_run)
         """
-        loop = asyncio.get_event_loop()
+        loop = asyncio.get_running_loop()
 
         def _do_forget():
             try:
@@ -135,6 +135,7 @@ def load_config(env_file: str = ".env", config_file: str = "config/agent.yaml")
         local_model_name=os.getenv("LOCAL_MODEL_NAME", local_model_config.get("name", "HuggingFaceTB/SmolLM2-1.7B-Instruct")),
         local_model_endpoint=os.getenv("LOCAL_MODEL_ENDPOINT", local_model_config.get("endpoint")),
         local_model_for=os.getenv("LOCAL_MODEL_FOR", local_model_config.get("use_for", "trivial,simple")),
+        local_model_quantization=os.getenv("LOCAL_MODEL_QUANTIZATION", local_model_config.get("quantization", "fp32")),
 
         # Specialized local coder model
         local_coder_enabled=os.getenv("LOCAL_CODER_ENABLED", str(local_model_config.get("coder", {}).get("enabled", False))).lower() == "true",
@@ -0,0 +1,56 @@
+"""Shared aiohttp session for outbound HTTP calls.
+
+Creating a fresh `aiohttp.ClientSession` per request forces a new TCP + TLS
+handshake every time. Tools and clients should call `get_session()` instead
+and let the pooled connector keep connections alive between calls.
+
+JSON request bodies are encoded with orjson; decode responses with
+`await resp.json(loads=orjson.loads)` for the same speedup.
+
+The session is created lazily on first use (it must be bound to the running
+event loop) and closed via `close_session()` during shutdown.
+"""
+
+import asyncio
+import logging
+from typing import Optional
+
+import aiohttp
+import orjson
+
+logger = logging.getLogger(__name__)
+
+_session: Optional[aiohttp.ClientSession] = None
+_session_lock = asyncio.Lock()
+
+
+async def get_session() -> aiohttp.ClientSession:
+    """Return the process-wide shared ClientSession, creating it if needed."""
+    global _session
+    if _session is not None and not _session.closed:
+        return _session
+    async with _session_lock:
+        if _session is None or _session.closed:
+            connector = aiohttp.TCPConnector(
+                limit=100,
+                limit_per_host=64,
+                keepalive_timeout=75,
+                ttl_dns_cache=300,
+                enable_cleanup_closed=True,
+            )
+            # orjson encodes json= payloads; aiohttp expects a str back
+            _session = aiohttp.ClientSession(
+                connector=connector,
+                json_serialize=lambda obj: orjson.dumps(obj).decode(),
+            )
+            logger.debug("Created shared aiohttp session")
+    return _session
+
+
+async def close_session():
+    """Close the shared session (call once on shutdown)."""
+    global _session
+    if _session is not None and not _session.closed:
+        await _session.close()
+        logger.debug("Closed shared aiohttp session")
+    _session = None
@@ -194,7 +194,8 @@ class AutoFixer:
 
         try:
             # Try to install the package (validated against requirements.txt)
-            result = subprocess.run(
+            result = await asyncio.to_thread(
+                subprocess.run,
                 ["pip", "install", module_name],
                 capture_output=True,
                 text=True,
@@ -250,10 +251,11 @@ class AutoFixer:
                 logger.info("Detected merge conflict - stashing changes")
 
                 # Stash changes
-                subprocess.run(["git", "stash"], check=True, capture_output=True)
+                await asyncio.to_thread(subprocess.run, ["git", "stash"], check=True, capture_output=True)
 
                 # Pull latest
-                result = subprocess.run(
+                result = await asyncio.to_thread(
+                    subprocess.run,
                     ["git", "pull", "origin", "main"],
                     capture_output=True,
                     text=True,
@@ -278,7 +280,8 @@ class AutoFixer:
 
         # Generic git error - try git status
         try:
-            result = subprocess.run(
+            result = await asyncio.to_thread(
+                subprocess.run,
                 ["git", "status"],
                 capture_output=True,
                 text=True,
@@ -371,7 +374,8 @@ class AutoFixer:
         if "config" in error.message.lower() and "model" in error.message.lower():
             try:
                 # Check if there are updates on git
-                result = subprocess.run(
+                result = await asyncio.to_thread(
+                    subprocess.run,
                     ["git", "fetch", "origin", "main"],
                     capture_output=True,
                     text=True,
@@ -379,7 +383,8 @@ class AutoFixer:
                 )
 
                 # Check if we're behind
-                result = subprocess.run(
+                result = await asyncio.to_thread(
+                    subprocess.run,
                     ["git", "rev-list", "HEAD..origin/main", "--count"],
                     capture_output=True,
                     text=True
@@ -461,7 +466,8 @@ class AutoFixer:
         # Type errors are usually code bugs, check git for fixes
         try:
             # Fetch latest
-            subprocess.run(
+            await asyncio.to_thread(
+                subprocess.run,
                 ["git", "fetch", "origin", "main"],
                 capture_output=True,
                 text=True,
@@ -469,7 +475,8 @@ class AutoFixer:
             )
 
             # Check if behind
-            result = subprocess.run(
+            result = await asyncio.to_thread(
+                subprocess.run,
                 ["git", "rev-list", "HEAD..origin/main", "--count"],
                 capture_output=True,
                 text=True
@@ -513,7 +520,8 @@ class AutoFixer:
 
         try:
             # Check if running as systemd service
-            result = subprocess.run(
+            result = await asyncio.to_thread(
+                subprocess.run,
                 ["systemctl", "is-active", "novabot"],
                 capture_output=True,
                 text=True
@@ -523,7 +531,8 @@ class AutoFixer:
                 # Service is not active, try to start it
                 logger.info("Service is down, attempting to restart")
 
-                restart_result = subprocess.run(
+                restart_result = await asyncio.to_thread(
+                    subprocess.run,
                     ["sudo", "systemctl", "restart", "novabot"],
                     capture_output=True,
                     text=True,
@@ -88,7 +88,9 @@ class SelfHealingMonitor:
         # Scan for errors since last check (or startup), advancing watermark each time
         # so the same errors are never reported twice
         scan_floor = self._last_scan_time if hasattr(self, '_last_scan_time') else self.startup_time
-        errors = self.detector.scan_recent_logs(
+        # Log tail + regex scan is blocking file I/O; run it off the event loop
+        errors = await asyncio.to_thread(
+            self.detector.scan_recent_logs,
             minutes=self.check_interval // 60,
             not_before=scan_floor
         )
@@ -353,7 +355,7 @@ Once merged, restart: `sudo systemctl restart novabot`"""
         """
         logger.info("Running manual health check...")
 
-        errors = self.detector.scan_recent_logs(minutes=30)  # Last 30 minutes
+        errors = await asyncio.to_thread(self.detector.scan_recent_logs, minutes=30)  # Last 30 minutes
 
         result = {
             "errors_detected": len(errors),
@@ -13,6 +13,8 @@ from pathlib import Path
 from typing import List, Dict, Any, Optional, Tuple
 from dataclasses import dataclass, asdict
 
+from ...utils.llm_json import parse_llm_json
+
 logger = logging.getLogger(__name__)
 
 
@@ -261,11 +263,8 @@ Reply with ONLY the JSON, no other text."""
                 if hasattr(block, 'text'):
                     text += block.text
 
-            # Parse JSON
-            # Strip markdown code fences if present
-            text = re.sub(r"```json?\s*", "", text)
-            text = re.sub(r"```\s*$", "", text)
-            data = json.loads(text.strip())
+            # Parse JSON (tolerates markdown fences and prose around it)
+            data = parse_llm_json(text)
 
             return InabilityGap(
                 response_text=response_text[:500],
@@ -8,6 +8,7 @@ Base URL: https://gamma-api.polymarket.com
 Rate limit: 60 requests/minute (public)
 """
 
+import asyncio
 import json
 import logging
 from typing import Optional
@@ -337,9 +338,13 @@ class PolymarketTool(BaseTool):
                             success=False,
                             error=f"Polymarket API error {resp.status}: {body[:150]}",
                         )
+        except asyncio.TimeoutError:
+            logger.warning(f"Polymarket request timed out: {path}")
+            return ToolResult(success=False, error="Polymarket API request timed out")
         except aiohttp.ClientError as e:
             logger.error(f"Polymarket network error: {e}")
             return ToolResult(success=False, error=f"Network error: {e}")
         except Exception as e:
+            # Unexpected — keep the traceback for debugging
             logger.error(f"Polymarket request failed: {e}", exc_info=True)
             return ToolResult(success=False, error=f"Request failed: {e}")
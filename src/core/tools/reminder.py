@@ -133,6 +133,10 @@ class ReminderTool(BaseTool):
                 return self._cancel_reminder(reminder_id)
             else:
                 return ToolResult(success=False, error=f"Unknown operation: {operation}")
+        except (OSError, json.JSONDecodeError) as e:
+            # Expected storage failures — no traceback needed
+            logger.error(f"Reminder storage error: {e}")
+            return ToolResult(success=False, error=f"Reminder operation failed: {str(e)}")
         except Exception as e:
             logger.error(f"Reminder operation error: {e}", exc_info=True)
             return ToolResult(success=False, error=f"Reminder operation failed: {str(e)}")
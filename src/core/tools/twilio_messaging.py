@@ -0,0 +1,58 @@
+"""Shared helpers for the Twilio WhatsApp tools."""
+
+import asyncio
+import re
+from typing import Optional
+
+from twilio.base.exceptions import TwilioRestException
+
+from ...utils.admission import get_admission
+
+# Separators stripped from phone numbers in one pass (str.translate)
+_PHONE_STRIP = str.maketrans("", "", "-_ \t().")
+# Optional + followed by 8-15 digits (E.164 range)
+_PHONE_RE = re.compile(r"^\+?\d{8,15}$")
+
+
+def whatsapp_address(to_number: str) -> Optional[str]:
+    """Normalize a phone number into a Twilio WhatsApp address.
+
+    Accepts an optional "whatsapp:" prefix and ASCII separators (dashes,
+    underscores, spaces, tabs, parentheses, dots). Bare 10-digit numbers
+    are treated as US/Canada.
+
+    Args:
+        to_number: Phone number as given by the caller
+
+    Returns:
+        "whatsapp:+<E.164 number>", or None if the input isn't a phone number
+    """
+    number = to_number.replace("whatsapp:", "").translate(_PHONE_STRIP)
+    if not _PHONE_RE.match(number):
+        return None
+    if len(number) == 10 and not number.startswith("+"):
+        number = f"+1{number}"
+    elif not number.startswith("+"):
+        number = f"+{number}"
+    return f"whatsapp:{number}"
+
+
+async def send_message(client, from_: str, to: str, body: str):
+    """Send a message through the Twilio REST client.
+
+    The Twilio Python SDK is sync, so the call runs off the event loop under
+    the shared "twilio" admission limit; a 429 shrinks that limit.
+
+    Returns:
+        The created Twilio message resource
+
+    Raises:
+        TwilioRestException: If Twilio rejects the message
+    """
+    try:
+        async with get_admission("twilio", target_latency=5.0).slot():
+            return await asyncio.to_thread(client.messages.create, from_=from_, body=body, to=to)
+    except TwilioRestException as e:
+        if e.status == 429:
+            get_admission("twilio").decrease()
+        raise
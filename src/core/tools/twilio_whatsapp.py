@@ -1,7 +1,9 @@
 from typing import Dict, Any
 import logging
 from .base import BaseTool, ToolResult
+from .twilio_messaging import send_message, whatsapp_address
 from twilio.rest import Client
+from twilio.base.exceptions import TwilioRestException
 
 logger = logging.getLogger(__name__)
 
@@ -70,26 +72,18 @@ class TwilioWhatsAppTool(BaseTool):
             )
             
         # Normalize phone number to E.164 format
-        import re
-        # Strip whatsapp: prefix if present so we can clean the number
-        to_number = to_number.replace("whatsapp:", "")
-        # Keep only digits and + sign (strips dashes, parens, spaces)
-        to_number = re.sub(r'[^\d+]', '', to_number)
-        # Auto-add +1 for bare 10-digit US/Canada numbers
-        if len(to_number) == 10 and not to_number.startswith("+"):
-            to_number = f"+1{to_number}"
-        elif not to_number.startswith("+"):
-            to_number = f"+{to_number}"
-        formatted_to = f"whatsapp:{to_number}"
-            
+        formatted_to = whatsapp_address(to_number)
+        if formatted_to is None:
+            return ToolResult(
+                error=f"Invalid phone number: {to_number}",
+                success=False
+            )
+
         try:
             logger.info(f"Sending Twilio WhatsApp message to {formatted_to}")
             
-            # Send message synchronously (Twilio Python SDK is sync)
-            message = self.client.messages.create(
-                from_=self.from_number,
-                body=message_body,
-                to=formatted_to
+            message = await send_message(
+                self.client, from_=self.from_number, to=formatted_to, body=message_body
             )
             
             return ToolResult(
@@ -98,6 +92,13 @@ class TwilioWhatsAppTool(BaseTool):
                 data={"message_sid": message.sid, "status": message.status}
             )
             
+        except TwilioRestException as e:
+            error_msg = f"Failed to send Twilio WhatsApp message: {str(e)}"
+            logger.error(error_msg)
+            return ToolResult(
+                error=error_msg,
+                success=False
+            )
         except Exception as e:
             error_msg = f"Failed to send Twilio WhatsApp message: {str(e)}"
             logger.error(error_msg, exc_info=True)
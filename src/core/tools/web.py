@@ -1,11 +1,16 @@
 """Web search and fetch tool."""
 
+import asyncio
 import ipaddress
 import aiohttp
 import logging
+import socket
+import time
+from bisect import bisect_right
 from urllib.parse import urlparse
-from typing import Optional
+from typing import Dict, List, Optional, Tuple
 from .base import BaseTool
+from ..http_session import get_session
 from ..types import ToolResult
 
 logger = logging.getLogger(__name__)
@@ -25,7 +30,88 @@ _BLOCKED_NETWORKS = [
 ]
 
 
-def _is_private_url(url: str) -> bool:
+def _build_ranges(version: int) -> List[Tuple[int, int]]:
+    """Collapse _BLOCKED_NETWORKS into sorted, merged (low, high) integer ranges."""
+    ranges = sorted(
+        (int(net.network_address), int(net.broadcast_address))
+        for net in _BLOCKED_NETWORKS if net.version == version
+    )
+    merged: List[Tuple[int, int]] = []
+    for low, high in ranges:
+        if merged and low <= merged[-1][1] + 1:
+            merged[-1] = (merged[-1][0], max(merged[-1][1], high))
+        else:
+            merged.append((low, high))
+    return merged
+
+
+_BLOCKED_RANGES_V4 = _build_ranges(4)
+_BLOCKED_RANGES_V6 = _build_ranges(6)
+
+
+def _in_ranges(value: int, table: List[Tuple[int, int]]) -> bool:
+    """Binary-search a sorted interval table for value."""
+    i = bisect_right(table, (value, float("inf"))) - 1
+    return i >= 0 and table[i][0] <= value <= table[i][1]
+
+
+def _is_blocked_ip(ip: str) -> bool:
+    """Check a resolved IP string against the blocked ranges.
+
+    Raises:
+        ValueError: If ip is not a valid IPv4/IPv6 address
+    """
+    try:
+        packed = socket.inet_pton(socket.AF_INET, ip)
+        return _in_ranges(int.from_bytes(packed, "big"), _BLOCKED_RANGES_V4)
+    except OSError:
+        pass
+    try:
+        # Drop any zone index (e.g. "fe80::1%eth0") before parsing
+        packed = socket.inet_pton(socket.AF_INET6, ip.split("%", 1)[0])
+    except OSError:
+        raise ValueError(f"Invalid IP address: {ip}")
+    return _in_ranges(int.from_bytes(packed, "big"), _BLOCKED_RANGES_V6)
+
+
+# DNS resolution cache: hostname -> (resolved_at, [addresses])
+_DNS_TTL_SECONDS = 300
+_dns_cache: Dict[str, Tuple[float, List[str]]] = {}
+# In-flight lookups, so concurrent fetches of one host share a single getaddrinfo
+_dns_inflight: Dict[str, asyncio.Future] = {}
+
+
+def _resolve_cached(hostname: str) -> List[str]:
+    """Resolve hostname to IP strings, reusing results younger than the TTL."""
+    now = time.monotonic()
+    entry = _dns_cache.get(hostname)
+    if entry and now - entry[0] < _DNS_TTL_SECONDS:
+        return entry[1]
+    addrs = [info[4][0] for info in socket.getaddrinfo(hostname, None)]
+    _dns_cache[hostname] = (now, addrs)
+    return addrs
+
+
+async def _resolve_host(hostname: str) -> List[str]:
+    """Resolve hostname off the event loop, deduplicating concurrent lookups."""
+    entry = _dns_cache.get(hostname)
+    if entry and time.monotonic() - entry[0] < _DNS_TTL_SECONDS:
+        return entry[1]
+
+    pending = _dns_inflight.get(hostname)
+    if pending is not None:
+        return await asyncio.shield(pending)
+
+    loop = asyncio.get_running_loop()
+    future = loop.run_in_executor(None, _resolve_cached, hostname)
+    _dns_inflight[hostname] = future
+    try:
+        return await asyncio.shield(future)
+    finally:
+        _dns_inflight.pop(hostname, None)
+
+
+async def _is_private_url(url: str) -> bool:
     """Check if a URL points to a private/internal IP address."""
     try:
         parsed = urlparse(url)
@@ -34,17 +120,29 @@ def _is_private_url(url: str) -> bool:
         if hostname in ("localhost", "metadata.google.internal"):
             return True
         # Resolve and check IP
-        import socket
-        for info in socket.getaddrinfo(hostname, None):
-            addr = ipaddress.ip_address(info[4][0])
-            for net in _BLOCKED_NETWORKS:
-                if addr in net:
-                    return True
+        for ip in await _resolve_host(hostname):
+            if _is_blocked_ip(ip):
+                return True
     except (ValueError, socket.gaierror, OSError):
         pass  # If we can't resolve, allow the request (will fail naturally)
     return False
 
 
+# Output limit in chars, and the most bytes we read to fill it (UTF-8 worst case)
+_MAX_OUTPUT_CHARS = 10000
+_MAX_FETCH_BYTES = _MAX_OUTPUT_CHARS * 4
+# Responses larger than this (per Content-Length) are skipped outright
+_MAX_CONTENT_LENGTH = 20 * 1024 * 1024
+_TEXT_CONTENT_TYPES = (
+    "text/", "application/json", "application/xml", "application/xhtml+xml",
+    "application/rss+xml", "application/atom+xml", "application/ld+json",
+)
+# Max concurrent fetches across all WebTool calls
+_MAX_CONCURRENT_FETCHES = 20
+# Successful fetches are reused for this long (LLM retries often refetch)
+_RESULT_TTL_SECONDS = 60
+
+
 class WebTool(BaseTool):
     """Tool for fetching web content."""
 
@@ -62,18 +160,88 @@ class WebTool(BaseTool):
         }
     }
 
+    # Shared across instances: concurrency cap, in-flight fetches, recent results
+    _semaphore = asyncio.Semaphore(_MAX_CONCURRENT_FETCHES)
+    _inflight: Dict[str, asyncio.Future] = {}
+    _results: Dict[str, Tuple[float, ToolResult]] = {}
+
     async def execute(self, url: str) -> ToolResult:
         """Fetch content from URL.
 
+        Concurrent calls for the same URL share one fetch, and successful
+        results are reused for a short TTL.
+
         Args:
             url: URL to fetch
 
         Returns:
             ToolResult with fetched content
         """
+        cached = self._results.get(url)
+        if cached and time.monotonic() - cached[0] < _RESULT_TTL_SECONDS:
+            return cached[1]
+
+        pending = self._inflight.get(url)
+        if pending is not None:
+            return await asyncio.shield(pending)
+
+        future = asyncio.get_running_loop().create_future()
+        self._inflight[url] = future
+        try:
+            async with self._semaphore:
+                result = await self._fetch(url)
+            if result.success:
+                now = time.monotonic()
+                # Drop expired entries so the cache stays small
+                for key in [k for k, (ts, _) in self._results.items()
+                            if now - ts >= _RESULT_TTL_SECONDS]:
+                    del self._results[key]
+                self._results[url] = (now, result)
+            future.set_result(result)
+            return result
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except Exception as e:
+            future.set_exception(e)
+            # Avoid "exception never retrieved" when nobody else was waiting
+            future.exception()
+            raise
+        finally:
+            self._inflight.pop(url, None)
+
+    async def _check_head(self, session, url: str) -> Optional[ToolResult]:
+        """HEAD the URL first to skip binaries and giant files before a GET.
+
+        Returns:
+            A failed ToolResult if the resource should not be fetched,
+            None to go ahead (including when HEAD is unsupported or fails)
+        """
+        try:
+            async with session.head(url, allow_redirects=True, timeout=10) as head:
+                if head.status != 200:
+                    return None  # 405 etc. — let the GET decide
+                content_type = head.headers.get("Content-Type", "").lower()
+                if content_type and not content_type.startswith(_TEXT_CONTENT_TYPES):
+                    return ToolResult(
+                        success=False,
+                        error=f"Unsupported content type ({content_type.split(';')[0]}): {url}"
+                    )
+                length = head.headers.get("Content-Length", "")
+                if length.isdigit() and int(length) > _MAX_CONTENT_LENGTH:
+                    return ToolResult(
+                        success=False,
+                        error=f"Resource too large ({int(length) // (1024 * 1024)} MB): {url}"
+                    )
+        except (aiohttp.ClientError, asyncio.TimeoutError):
+            pass
+        return None
+
+    async def _fetch(self, url: str) -> ToolResult:
+        """Fetch a URL (SSRF-checked, size-capped)."""
         try:
             # SSRF protection — block private/internal network access
-            if _is_private_url(url):
+            if await _is_private_url(url):
                 logger.warning(f"SSRF blocked: {url}")
                 return ToolResult(
                     success=False,
@@ -82,21 +250,31 @@ class WebTool(BaseTool):
 
             logger.info(f"Fetching URL: {url}")
 
-            async with aiohttp.ClientSession() as session:
-                async with session.get(url, timeout=30) as response:
-                    if response.status == 200:
-                        content = await response.text()
-                        logger.info(f"Fetched {len(content)} chars from {url}")
-                        return ToolResult(
-                            success=True,
-                            output=content[:10000],  # Limit to 10k chars
-                            metadata={"url": url, "status": response.status}
-                        )
-                    else:
-                        return ToolResult(
-                            success=False,
-                            error=f"HTTP {response.status}: {url}"
-                        )
+            session = await get_session()
+            rejected = await self._check_head(session, url)
+            if rejected:
+                return rejected
+
+            async with session.get(url, timeout=30) as response:
+                if response.status in (200, 206):
+                    # Stream the body and stop once we have enough to fill the output
+                    buf = bytearray()
+                    async for chunk in response.content.iter_chunked(8192):
+                        buf.extend(chunk)
+                        if len(buf) >= _MAX_FETCH_BYTES:
+                            break
+                    content = buf.decode(response.charset or "utf-8", errors="replace")
+                    logger.info(f"Fetched {len(buf)} bytes from {url}")
+                    return ToolResult(
+                        success=True,
+                        output=content[:_MAX_OUTPUT_CHARS],
+                        metadata={"url": url, "status": response.status}
+                    )
+                else:
+                    return ToolResult(
+                        success=False,
+                        error=f"HTTP {response.status}: {url}"
+                    )
 
         except aiohttp.ClientError as e:
             logger.error(f"Network error fetching {url}: {e}")
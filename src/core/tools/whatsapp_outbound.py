@@ -4,7 +4,9 @@ import os
 import logging
 from typing import Dict, Any, Optional
 from twilio.rest import Client
+from twilio.base.exceptions import TwilioRestException
 from .base import BaseTool, ToolResult
+from .twilio_messaging import send_message, whatsapp_address
 
 logger = logging.getLogger(__name__)
 
@@ -75,29 +77,20 @@ class WhatsAppOutboundTool(BaseTool):
                 success=False
             )
 
-        # Strip whatsapp: prefix if accidentally passed so we can format the number
-        to_number = to_number.replace("whatsapp:", "")
-        
-        # Clean up the number by removing spaces, dashes, parentheses
-        import re
-        to_number = re.sub(r'[^\d+]', '', to_number)
-
-        # If it's a 10-digit number without a country code, assume US/Canada and add +1
-        if len(to_number) == 10 and not to_number.startswith("+"):
-            to_number = f"+1{to_number}"
-        elif not to_number.startswith("+"):
-            to_number = f"+{to_number}"
-
-        # Ensure 'whatsapp:' prefix for destination
-        to_number = f"whatsapp:{to_number}"
+        # Normalize to a 'whatsapp:+E.164' destination
+        formatted_to = whatsapp_address(to_number)
+        if formatted_to is None:
+            return ToolResult(
+                error=f"Invalid phone number: {to_number}",
+                success=False
+            )
+        to_number = formatted_to
 
         try:
             logger.info(f"📤 Sending outbound WhatsApp message to {to_number}")
 
-            result = self.client.messages.create(
-                from_=self.from_number,
-                body=message,
-                to=to_number
+            result = await send_message(
+                self.client, from_=self.from_number, to=to_number, body=message
             )
 
             logger.info(f"📤 WhatsApp message sent (SID: {result.sid})")
@@ -108,6 +101,13 @@ class WhatsAppOutboundTool(BaseTool):
                 data={"message_sid": result.sid}
             )
 
+        except TwilioRestException as e:
+            error_msg = f"Failed to send outbound WhatsApp message: {str(e)}"
+            logger.error(error_msg)
+            return ToolResult(
+                error=error_msg,
+                success=False
+            )
         except Exception as e:
             error_msg = f"Failed to send outbound WhatsApp message: {str(e)}"
             logger.error(error_msg, exc_info=True)
@@ -1,7 +1,11 @@
 """X (Twitter) posting tool using X API v2 with OAuth 1.0a User Context."""
 
+import asyncio
 import json
 import logging
+import os
+import re
+import threading
 from pathlib import Path
 from typing import Optional, Dict, Any
 from .base import BaseTool
@@ -94,10 +98,12 @@ class XTool(BaseTool):
         self.data_dir = Path(data_dir)
         self.communities_cache_file = self.data_dir / "x_communities.json"
         self.user_cache_file = self.data_dir / "x_user_cache.json"
+        # One OAuth1Session per executor thread (requests sessions aren't
+        # thread-safe), reused so calls keep their TLS connection to api.x.com
+        self._sessions = threading.local()
 
         # Pre-seed cache from env vars (X_COMMUNITY_ID + X_COMMUNITY_NAME)
         # This lets users avoid the API lookup entirely for their main community
-        import os
         default_community_id = os.getenv("X_COMMUNITY_ID", "").strip()
         default_community_name = os.getenv("X_COMMUNITY_NAME", "").strip()
         if default_community_id and default_community_name:
@@ -119,14 +125,18 @@ class XTool(BaseTool):
         }
 
     def _get_oauth1_session(self):
-        """Create an OAuth 1.0a session using requests_oauthlib."""
-        from requests_oauthlib import OAuth1Session
-        return OAuth1Session(
-            self.api_key,
-            client_secret=self.api_secret,
-            resource_owner_key=self.access_token,
-            resource_owner_secret=self.access_token_secret
-        )
+        """Return this thread's OAuth 1.0a session (requests_oauthlib), creating it once."""
+        oauth = getattr(self._sessions, "oauth", None)
+        if oauth is None:
+            from requests_oauthlib import OAuth1Session
+            oauth = OAuth1Session(
+                self.api_key,
+                client_secret=self.api_secret,
+                resource_owner_key=self.access_token,
+                resource_owner_secret=self.access_token_secret
+            )
+            self._sessions.oauth = oauth
+        return oauth
 
     async def execute(
         self,
@@ -186,7 +196,6 @@ class XTool(BaseTool):
 
     def _extract_tweet_id(self, tweet_id_or_url: str) -> Optional[str]:
         """Extract tweet ID from a URL or return as-is if already an ID."""
-        import re
         s = tweet_id_or_url.strip()
         # Already a numeric ID
         if s.isdigit():
@@ -202,8 +211,6 @@ class XTool(BaseTool):
 
         Uses X API v2 /tweets/:id with expansions for author info and metrics.
         """
-        import asyncio
-
         if not tweet_id:
             return ToolResult(success=False, error="tweet_id or tweet URL is required for get_tweet")
 
@@ -222,7 +229,7 @@ class XTool(BaseTool):
                 }
             )
 
-        loop = asyncio.get_event_loop()
+        loop = asyncio.get_running_loop()
         resp = await loop.run_in_executor(None, _fetch)
 
         if resp.status_code != 200:
@@ -283,8 +290,7 @@ class XTool(BaseTool):
         if not query:
             return ToolResult(success=False, error="query is required for search_tweets")
 
-        import asyncio
-        loop = asyncio.get_event_loop()
+        loop = asyncio.get_running_loop()
 
         # ── Strategy 1: Real X API ────────────────────────────────────────────
         def _api_search():
@@ -383,8 +389,6 @@ class XTool(BaseTool):
         Uses GET /2/communities/search to find communities matching a query.
         Results are cached so future post_to_community calls can resolve by name.
         """
-        import asyncio
-
         if not query:
             return ToolResult(success=False, error="query is required for search_communities")
 
@@ -400,7 +404,7 @@ class XTool(BaseTool):
                 }
             )
 
-        loop = asyncio.get_event_loop()
+        loop = asyncio.get_running_loop()
         resp = await loop.run_in_executor(None, _do_search)
 
         if resp.status_code != 200:
@@ -456,8 +460,6 @@ class XTool(BaseTool):
         Resolves community name to ID via cache if a name is given.
         Requires read access (pay-per-use or Basic tier).
         """
-        import asyncio
-
         if not community_id:
             return ToolResult(success=False, error="community_id (name or numeric ID) is required for read_community")
 
@@ -472,7 +474,7 @@ class XTool(BaseTool):
                 )
             )
 
-        loop = asyncio.get_event_loop()
+        loop = asyncio.get_running_loop()
         n = min(max(max_results, 10), 100)
 
         def _fetch():
@@ -529,8 +531,6 @@ class XTool(BaseTool):
         Returns name, bio, follower/following counts, tweet count, and
         whether the account is verified. Works without any paid API tier.
         """
-        import asyncio
-
         if not username:
             return ToolResult(success=False, error="target_username is required for lookup_user")
 
@@ -545,7 +545,7 @@ class XTool(BaseTool):
                 }
             )
 
-        loop = asyncio.get_event_loop()
+        loop = asyncio.get_running_loop()
         resp = await loop.run_in_executor(None, _fetch)
 
         if resp.status_code != 200:
@@ -587,8 +587,6 @@ class XTool(BaseTool):
 
     async def _post_tweet(self, content: Optional[str]) -> ToolResult:
         """Post a tweet to X."""
-        import asyncio
-
         if not content:
             return ToolResult(success=False, error="Tweet content is required")
 
@@ -606,7 +604,7 @@ class XTool(BaseTool):
             )
             return resp
 
-        loop = asyncio.get_event_loop()
+        loop = asyncio.get_running_loop()
         resp = await loop.run_in_executor(None, _do_post)
 
         if resp.status_code in (200, 201):
@@ -637,8 +635,6 @@ class XTool(BaseTool):
         community_id: Optional[str]
     ) -> ToolResult:
         """Post a tweet to an X Community."""
-        import asyncio
-
         if not content:
             return ToolResult(success=False, error="Tweet content is required")
         if not community_id:
@@ -671,7 +667,7 @@ class XTool(BaseTool):
                 json={"text": content, "community_id": resolved_id, "share_with_followers": True}
             )
 
-        loop = asyncio.get_event_loop()
+        loop = asyncio.get_running_loop()
         resp = await loop.run_in_executor(None, _do_post)
 
         if resp.status_code not in (200, 201):
@@ -702,8 +698,6 @@ class XTool(BaseTool):
         Otherwise, check cache first, then search X API.
         Caches results for future lookups.
         """
-        import asyncio
-
         # Already a numeric ID
         if name_or_id.isdigit():
             return name_or_id
@@ -729,7 +723,7 @@ class XTool(BaseTool):
             return resp
 
         try:
-            loop = asyncio.get_event_loop()
+            loop = asyncio.get_running_loop()
             resp = await loop.run_in_executor(None, _do_search)
 
             if resp.status_code != 200:
@@ -830,8 +824,6 @@ class XTool(BaseTool):
 
     async def _delete_tweet(self, tweet_id: Optional[str]) -> ToolResult:
         """Delete a tweet from X."""
-        import asyncio
-
         if not tweet_id:
             return ToolResult(success=False, error="tweet_id is required")
 
@@ -839,7 +831,7 @@ class XTool(BaseTool):
             oauth = self._get_oauth1_session()
             return oauth.delete(f"{self.api_base}/tweets/{tweet_id}")
 
-        loop = asyncio.get_event_loop()
+        loop = asyncio.get_running_loop()
         resp = await loop.run_in_executor(None, _do_delete)
 
         if resp.status_code == 200:
@@ -853,8 +845,6 @@ class XTool(BaseTool):
 
     async def _retweet(self, tweet_id: Optional[str]) -> ToolResult:
         """Retweet a tweet."""
-        import asyncio
-
         if not tweet_id:
             return ToolResult(success=False, error="tweet_id is required for retweet")
 
@@ -873,7 +863,7 @@ class XTool(BaseTool):
             )
             return resp
 
-        loop = asyncio.get_event_loop()
+        loop = asyncio.get_running_loop()
         resp = await loop.run_in_executor(None, _do_retweet)
 
         if resp.status_code in (200, 201):
@@ -894,8 +884,6 @@ class XTool(BaseTool):
         community_id: Optional[str] = None
     ) -> ToolResult:
         """Quote a tweet (with optional community support)."""
-        import asyncio
-
         if not tweet_id:
             return ToolResult(success=False, error="tweet_id is required for quote_tweet")
         if not content:
@@ -928,7 +916,7 @@ class XTool(BaseTool):
             )
             return resp
 
-        loop = asyncio.get_event_loop()
+        loop = asyncio.get_running_loop()
         resp = await loop.run_in_executor(None, _do_quote)
 
         if resp.status_code in (200, 201):
@@ -945,8 +933,6 @@ class XTool(BaseTool):
 
     async def _get_me(self) -> Optional[str]:
         """Get authenticated user ID (cached)."""
-        import asyncio
-
         # Check cache
         if self.user_cache_file.exists():
             try:
@@ -961,7 +947,7 @@ class XTool(BaseTool):
             oauth = self._get_oauth1_session()
             return oauth.get(f"{self.api_base}/users/me")
 
-        loop = asyncio.get_event_loop()
+        loop = asyncio.get_running_loop()
         resp = await loop.run_in_executor(None, _fetch_me)
 
         if resp.status_code == 200:
@@ -986,7 +972,6 @@ class XTool(BaseTool):
         Returns:
             The user's numeric ID, or None if failed.
         """
-        import asyncio
         
         # Strip '@' if provided
         safe_username = username.strip().lstrip('@')
@@ -996,7 +981,7 @@ class XTool(BaseTool):
             return oauth.get(f"{self.api_base}/users/by/username/{safe_username}")
             
         try:
-            loop = asyncio.get_event_loop()
+            loop = asyncio.get_running_loop()
             resp = await loop.run_in_executor(None, _fetch_user)
             
             if resp.status_code == 200:
@@ -1011,7 +996,6 @@ class XTool(BaseTool):
 
     async def _follow_user(self, target_username: Optional[str]) -> ToolResult:
         """Follow a user on X."""
-        import asyncio
         
         if not target_username:
             return ToolResult(success=False, error="target_username is required to follow a user")
@@ -1036,7 +1020,7 @@ class XTool(BaseTool):
             )
             return resp
             
-        loop = asyncio.get_event_loop()
+        loop = asyncio.get_running_loop()
         resp = await loop.run_in_executor(None, _do_follow)
         
         if resp.status_code in (200, 201):
@@ -19,6 +19,15 @@ class BrainType(Enum):
     DIGITAL_CLONE = "digital_clone"  # For production
 
 
+class PartialReply(str):
+    """Progress update carrying the partial text of a streamed reply.
+
+    Behaves as a plain string for any progress callback; channels that
+    edit a status message in place can check for it and then edit the
+    final reply into that message instead of replacing it.
+    """
+
+
 @dataclass
 class ToolResult:
     """Result from a tool execution."""
@@ -60,6 +69,7 @@ class AgentConfig:
     local_model_name: str = "HuggingFaceTB/SmolLM2-1.7B-Instruct"  # Status, reports, monitoring
     local_model_endpoint: Optional[str] = None  # e.g., "http://localhost:8000"
     local_model_for: str = "trivial,simple"  # Comma-separated: trivial, simple, chat, intent
+    local_model_quantization: str = "fp32"  # fp32, bf16, or int8 (direct inference only)
 
     # Specialized local models for specific tasks
     local_coder_enabled: bool = False
@@ -1,14 +1,121 @@
 """Anthropic API client wrapper for Claude."""
 
-import anthropic
-from typing import List, Dict, Any, Optional
+from typing import TYPE_CHECKING, List, Dict, Any, Optional, Union
 import asyncio
+import functools
+import json
 import logging
 
 from ..utils import api_alert
+from ..utils.admission import get_admission, retry_after
+from ..utils.ratelimit import get_window
+
+if TYPE_CHECKING:
+    import anthropic
 
 logger = logging.getLogger(__name__)
 
+# Extra attempts after the SDK's own retries give up on a 429
+_RATE_LIMIT_RETRIES = 1
+
+# Shortest prefix Anthropic will cache, by model family (first matching model
+# ID prefix wins); shorter prefixes are silently processed uncached
+_MIN_CACHEABLE_TOKENS = (
+    ("claude-haiku-4", 4096),
+    ("claude-3-haiku", 2048),
+    ("claude-3-5-haiku", 2048),
+    ("claude-opus-4-5", 4096),
+    ("claude-opus-4-6", 4096),
+)
+_DEFAULT_MIN_CACHEABLE_TOKENS = 1024  # Sonnet, Opus 4/4.1
+
+
+@functools.lru_cache(maxsize=1)
+def _get_encoding():
+    """Load the BPE encoding on first use (may read/download the vocab).
+
+    Claude's tokenizer isn't public; cl100k_base is a close proxy.
+    Optional dependency — returns None to fall back to ~4 chars/token.
+    """
+    try:
+        import tiktoken
+        return tiktoken.get_encoding("cl100k_base")
+    except Exception:
+        return None
+
+
+@functools.lru_cache(maxsize=1024)
+def _count_tokens_cached(text: str) -> int:
+    """Estimate tokens in text (memoized; system prompts repeat across calls)."""
+    encoding = _get_encoding()
+    if encoding is None:
+        return len(text) // 4
+    return len(encoding.encode(text, disallowed_special=()))
+
+
+def min_cacheable_tokens(model: str) -> int:
+    """Shortest prefix, in tokens, the provider caches for this model."""
+    model = model.removeprefix("anthropic/")
+    for prefix, tokens in _MIN_CACHEABLE_TOKENS:
+        if model.startswith(prefix):
+            return tokens
+    return _DEFAULT_MIN_CACHEABLE_TOKENS
+
+
+def is_cacheable_prefix(text: str, model: str) -> bool:
+    """Return True if text is long enough for the provider to cache it for model."""
+    return _count_tokens_cached(text) >= min_cacheable_tokens(model)
+
+
+class CachedPrefixPrompt(str):
+    """System prompt string whose first `prefix_len` chars are static.
+
+    Behaves as a plain string everywhere (LiteLLM, logging, token counts);
+    AnthropicClient sends it as two system blocks with the static prefix
+    marked for prompt caching once that prefix is long enough to cache.
+    """
+
+    prefix_len: int = 0
+
+    @classmethod
+    def join(cls, static: str, dynamic: str) -> "CachedPrefixPrompt":
+        prompt = cls(static + dynamic)
+        prompt.prefix_len = len(static)
+        return prompt
+
+
+def _system_blocks(
+    system: Union[str, List[Dict[str, Any]], None], model: str
+) -> Union[str, List[Dict[str, Any]], None]:
+    """Mark the cacheable prefix of a system prompt for the given model.
+
+    A CachedPrefixPrompt is split into a cacheable block and a dynamic
+    block. In a list of blocks, a ``cache_control`` marker is dropped when
+    the prefix up to it is below the model's minimum, since the provider
+    would not cache it anyway.
+    """
+    if isinstance(system, list):
+        blocks, prefix = [], ""
+        for block in system:
+            prefix += block.get("text", "")
+            if "cache_control" in block and not is_cacheable_prefix(prefix, model):
+                block = {k: v for k, v in block.items() if k != "cache_control"}
+            blocks.append(block)
+        return blocks
+    if not isinstance(system, CachedPrefixPrompt) or not system.prefix_len:
+        return system
+    if not is_cacheable_prefix(str(system[:system.prefix_len]), model):
+        return str(system)
+    blocks = [{
+        "type": "text",
+        "text": str(system[:system.prefix_len]),
+        "cache_control": {"type": "ephemeral"},
+    }]
+    dynamic = str(system[system.prefix_len:])
+    if dynamic.strip():
+        blocks.append({"type": "text", "text": dynamic})
+    return blocks
+
 
 class AnthropicClient:
     """Wrapper for Anthropic API to handle Claude interactions."""
@@ -19,45 +126,97 @@ class AnthropicClient:
         Args:
             api_key: Anthropic API key
         """
-        self.client = anthropic.Anthropic(api_key=api_key)
         self.api_key = api_key
+        # SDK client is built on first use so importing/constructing stays cheap
+        self._client = None
+        # Shared AIMD concurrency limit across all Anthropic callers
+        self.admission = get_admission("anthropic", target_latency=30.0)
+
+    @property
+    def client(self) -> "anthropic.AsyncAnthropic":
+        """Native async client over one pooled httpx connection pool.
+
+        Uses HTTP/2 when `h2` is installed so concurrent requests multiplex
+        over a few connections instead of one TLS handshake each.
+        """
+        if self._client is None:
+            import anthropic
+            import httpx
+
+            try:
+                import h2  # noqa: F401 — required by httpx for http2=True
+                http2 = True
+            except ImportError:
+                http2 = False
+
+            self._client = anthropic.AsyncAnthropic(
+                api_key=self.api_key,
+                max_retries=2,
+                timeout=httpx.Timeout(60.0, connect=5.0),
+                http_client=httpx.AsyncClient(
+                    http2=http2,
+                    limits=httpx.Limits(
+                        max_connections=20 if http2 else 100,
+                        max_keepalive_connections=20 if http2 else 50,
+                        keepalive_expiry=75,
+                    )
+                ),
+            )
+        return self._client
 
     async def create_message(
         self,
         model: str,
         messages: List[Dict[str, Any]],
         tools: Optional[List[Dict[str, Any]]] = None,
-        system: Optional[str] = None,
+        system: Optional[Union[str, List[Dict[str, Any]]]] = None,
         max_tokens: int = 4096,
         temperature: float = 1.0,
-    ) -> anthropic.types.Message:
+    ) -> "anthropic.types.Message":
         """Create a message with Claude API.
 
         Args:
             model: Model ID (e.g., 'claude-opus-4-6')
             messages: List of messages in conversation
             tools: Optional list of tool definitions
-            system: Optional system prompt
+            system: Optional system prompt, either a string or a list of
+                text blocks (blocks may carry ``cache_control`` so the
+                provider reuses the cached prefix); a CachedPrefixPrompt
+                is split into such blocks
             max_tokens: Maximum tokens to generate
             temperature: Temperature for sampling
 
         Returns:
             Message response from Claude
         """
+        import anthropic
+
         try:
-            # Run sync client in executor to avoid blocking
-            loop = asyncio.get_event_loop()
-            response = await loop.run_in_executor(
-                None,
-                lambda: self.client.messages.create(
-                    model=model,
-                    messages=messages,
-                    tools=tools or [],
-                    system=system or "You are a helpful AI assistant.",
-                    max_tokens=max_tokens,
-                    temperature=temperature,
-                )
-            )
+            # Client-side RPM/TPM window — throttle before the provider has to
+            est_tokens = self.count_message_tokens(messages, system) + max_tokens
+            await get_window(model).wait_if_throttled(est_tokens)
+
+            for attempt in range(_RATE_LIMIT_RETRIES + 1):
+                try:
+                    async with self.admission.slot():
+                        raw = await self.client.messages.with_raw_response.create(
+                            model=model,
+                            messages=messages,
+                            tools=tools or [],
+                            system=_system_blocks(system, model) or "You are a helpful AI assistant.",
+                            max_tokens=max_tokens,
+                            temperature=temperature,
+                        )
+                    self.admission.observe_headers(raw.headers)
+                    response = raw.parse()
+                    break
+                except anthropic.RateLimitError as e:
+                    self.admission.decrease()
+                    if attempt >= _RATE_LIMIT_RETRIES:
+                        raise
+                    delay = retry_after(e.response.headers)
+                    logger.warning(f"Anthropic rate limited, retrying in {delay:.1f}s")
+                    await asyncio.sleep(delay)
 
             # Log token usage
             usage = response.usage
@@ -79,7 +238,7 @@ class AnthropicClient:
         model: str,
         messages: List[Dict[str, Any]],
         tools: Optional[List[Dict[str, Any]]] = None,
-        system: Optional[str] = None,
+        system: Optional[Union[str, List[Dict[str, Any]]]] = None,
         max_tokens: int = 4096,
     ):
         """Create a streaming message with Claude API.
@@ -88,23 +247,37 @@ class AnthropicClient:
             model: Model ID
             messages: List of messages
             tools: Optional tool definitions
-            system: Optional system prompt
+            system: Optional system prompt (string or text blocks)
             max_tokens: Maximum tokens
 
         Yields:
             Message chunks from Claude
         """
+        import anthropic
+
         try:
-            with self.client.messages.stream(
-                model=model,
-                messages=messages,
-                tools=tools or [],
-                system=system or "You are a helpful AI assistant.",
-                max_tokens=max_tokens,
-            ) as stream:
-                for chunk in stream:
-                    yield chunk
+            # Same RPM/TPM window and concurrency limit as create_message;
+            # the slot is held until the stream finishes
+            est_tokens = self.count_message_tokens(messages, system) + max_tokens
+            await get_window(model).wait_if_throttled(est_tokens)
 
+            async with self.admission.slot():
+                async with self.client.messages.stream(
+                    model=model,
+                    messages=messages,
+                    tools=tools or [],
+                    system=_system_blocks(system, model) or "You are a helpful AI assistant.",
+                    max_tokens=max_tokens,
+                ) as stream:
+                    self.admission.observe_headers(stream.response.headers)
+                    async for chunk in stream:
+                        yield chunk
+
+        except anthropic.RateLimitError as e:
+            # No retry here: the caller may already have shown partial output
+            self.admission.decrease()
+            logger.error(f"Anthropic API streaming error: {e}")
+            raise
         except anthropic.APIError as e:
             logger.error(f"Anthropic API streaming error: {e}")
             raise
@@ -112,14 +285,44 @@ class AnthropicClient:
     def count_tokens(self, text: str) -> int:
         """Estimate token count for text.
 
+        Uses the cl100k_base BPE when tiktoken is installed; results are
+        cached so repeated history/system text is only encoded once.
+
         Args:
             text: Text to count tokens for
 
         Returns:
             Approximate token count
         """
-        # Rough estimation: ~4 characters per token
-        return len(text) // 4
+        return _count_tokens_cached(text)
+
+    def count_message_tokens(
+        self,
+        messages: List[Dict[str, Any]],
+        system: Optional[Union[str, List[Dict[str, Any]]]] = None,
+    ) -> int:
+        """Estimate tokens for a conversation, counting each message separately.
+
+        Per-message counting lets unchanged history hit the cache instead of
+        re-encoding the whole prompt every turn.
+
+        Args:
+            messages: List of messages in conversation
+            system: Optional system prompt (string or text blocks)
+
+        Returns:
+            Approximate token count
+        """
+        if isinstance(system, list):
+            total = sum(self.count_tokens(block.get("text", "")) for block in system)
+        else:
+            total = self.count_tokens(system) if system else 0
+        for msg in messages:
+            content = msg.get("content", "") if isinstance(msg, dict) else msg
+            if not isinstance(content, str):
+                content = json.dumps(content, default=str)
+            total += self.count_tokens(content)
+        return total
 
     async def test_connection(self) -> bool:
         """Test if API connection works.
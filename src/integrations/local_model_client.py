@@ -1,12 +1,45 @@
 """Local model client for CPU inference."""
 
+import asyncio
 import logging
 import json
-from typing import Optional, Dict, Any, List
-import requests
+import threading
+from collections import OrderedDict
+from typing import Optional, Dict, Any, List, Literal
+
+import aiohttp
+import orjson
+
+from ..core.http_session import get_session
 
 logger = logging.getLogger(__name__)
 
+# Max prompt tokens fed to the local model
+_MAX_INPUT_TOKENS = 2048
+# Number of tokenized prompt prefixes kept for reuse across turns
+_PREFIX_CACHE_SIZE = 8
+# Concurrent direct-inference requests are batched into one generate() call
+_BATCH_SIZE = 8
+_BATCH_WINDOW_SECONDS = 0.01
+_QUANTIZATIONS = ("fp32", "bf16", "int8")
+
+
+def _cpu_has_native_bf16() -> bool:
+    """True if the CPU has bf16 matmul instructions (AVX-512_BF16 or AMX).
+
+    Without them bf16 is emulated and can be slower than fp32. Only Linux
+    reports the flags; other platforms are treated as unsupported.
+    """
+    try:
+        with open("/proc/cpuinfo") as f:
+            for line in f:
+                if line.startswith("flags"):
+                    flags = line.split()
+                    return "avx512_bf16" in flags or "amx_bf16" in flags
+    except OSError:
+        pass
+    return False
+
 
 class LocalModelClient:
     """Client for local model inference (CPU-based)."""
@@ -16,7 +49,8 @@ class LocalModelClient:
         model_name: str = "HuggingFaceTB/SmolLM2-1.7B-Instruct",
         endpoint: Optional[str] = None,
         max_tokens: int = 512,
-        temperature: float = 0.7
+        temperature: float = 0.7,
+        quantization: Literal["fp32", "bf16", "int8"] = "fp32"
     ):
         """Initialize local model client.
 
@@ -25,18 +59,39 @@ class LocalModelClient:
             endpoint: Local inference server endpoint (e.g., http://localhost:8000)
             max_tokens: Maximum tokens to generate
             temperature: Sampling temperature
+            quantization: Weight precision for direct inference — "fp32",
+                "bf16" (half the memory; falls back to fp32 on CPUs without
+                native bf16), or "int8" (dynamic int8 Linear layers)
         """
         self.model_name = model_name
         self.endpoint = endpoint
         self.max_tokens = max_tokens
         self.temperature = temperature
+        if quantization not in _QUANTIZATIONS:
+            logger.warning(f"Unknown local model quantization {quantization!r}, using fp32")
+            quantization = "fp32"
+        self.quantization = quantization
         self.model = None
         self.tokenizer = None
-
-        # Only load model if no endpoint specified (direct inference)
-        if not endpoint:
+        # prompt prefix text -> token ids, so repeated prefixes are tokenized once
+        self._prefix_ids: "OrderedDict[str, Any]" = OrderedDict()
+        # Pending (prompt, max_tokens, temperature, system_prefix, future) items
+        self._queue: Optional[asyncio.Queue] = None
+        self._batch_worker: Optional[asyncio.Task] = None
+        # Direct-inference model is loaded on first use, not at construction
+        self._load_attempted = False
+        self._load_lock = threading.Lock()
+
+    def _ensure_loaded(self):
+        """Load the model once, on first use (no-op with an endpoint)."""
+        if self.endpoint or self._load_attempted:
+            return
+        with self._load_lock:
+            if self._load_attempted:
+                return
+            self._load_attempted = True
             try:
-                logger.info(f"Loading local model: {model_name}")
+                logger.info(f"Loading local model: {self.model_name}")
                 self._load_model()
             except Exception as e:
                 logger.warning(f"Failed to load local model: {e}")
@@ -51,15 +106,41 @@ class LocalModelClient:
             # Load tokenizer
             self.tokenizer = AutoTokenizer.from_pretrained(self.model_name)
 
+            if self.quantization == "bf16" and not _cpu_has_native_bf16():
+                logger.warning("CPU lacks native bf16 (AVX-512_BF16/AMX), loading local model in fp32")
+                self.quantization = "fp32"
+
+            # bf16 halves weight memory traffic; int8 is applied after loading in fp32
+            dtype = torch.bfloat16 if self.quantization == "bf16" else torch.float32
+
             # Load model with CPU
             self.model = AutoModelForCausalLM.from_pretrained(
                 self.model_name,
-                torch_dtype=torch.float32,  # Use float32 for CPU
+                torch_dtype=dtype,
                 device_map="cpu",
-                low_cpu_mem_usage=True
+                low_cpu_mem_usage=True,
+                attn_implementation="sdpa"  # Fused scaled-dot-product attention
             )
 
-            logger.info(f"✅ Loaded {self.model_name} on CPU")
+            if self.quantization == "int8":
+                # Dynamic int8 quantization of Linear layers (CPU-only, no extra deps)
+                self.model = torch.ao.quantization.quantize_dynamic(
+                    self.model, {torch.nn.Linear}, dtype=torch.qint8
+                )
+
+            # Fuse kernels via inductor; generate() calls forward, so compile that
+            # Compilation is lazy, so a broken inductor (e.g. no C++ toolchain)
+            # only fails in the warm-up; keep eager forward in that case
+            eager_forward = self.model.forward
+            try:
+                self.model.forward = torch.compile(eager_forward, dynamic=True)
+                # Warm up once so compilation isn't paid on the first request
+                self._generate_local("Hello", max_tokens=2, temperature=0)
+            except Exception as e:
+                self.model.forward = eager_forward
+                logger.warning(f"torch.compile unavailable, using eager mode: {e}")
+
+            logger.info(f"✅ Loaded {self.model_name} on CPU ({self.quantization})")
 
         except ImportError:
             logger.error("transformers or torch not installed. Run: pip install transformers torch")
@@ -97,7 +178,11 @@ class LocalModelClient:
             if self.endpoint:
                 response_text = await self._generate_via_endpoint(prompt, max_tokens, temperature)
             else:
-                response_text = self._generate_local(prompt, max_tokens, temperature)
+                # System part plus the join separator: the leading text of every prompt
+                system_prefix = f"System: {system}\n\n" if system else None
+                response_text = await self._generate_batched(
+                    prompt, max_tokens, temperature, system_prefix
+                )
 
             # Format response to match Anthropic API
             return {
@@ -141,27 +226,87 @@ class LocalModelClient:
 
         return "\n".join(prompt_parts)
 
-    def _generate_local(self, prompt: str, max_tokens: int, temperature: float) -> str:
+    def _encode_prompt(self, prompt: str, system_prefix: Optional[str] = None):
+        """Tokenize prompt, reusing token ids of the longest cached prefix.
+
+        Each prompt is cached whole — the next turn's prompt starts with it,
+        so only the new turn is tokenized. The system prefix is cached on
+        its own so single-turn calls with the same system prompt reuse it.
+
+        Args:
+            prompt: Full prompt text
+            system_prefix: Leading system section of the prompt, if any
+
+        Returns:
+            Input ids tensor of shape (1, n)
+        """
+        import torch
+
+        def encode(text: str, special: bool):
+            return self.tokenizer(
+                text, return_tensors="pt", add_special_tokens=special
+            ).input_ids
+
+        if system_prefix and system_prefix not in self._prefix_ids:
+            self._prefix_ids[system_prefix] = encode(system_prefix, True)
+
+        best = max(
+            (k for k in self._prefix_ids if prompt.startswith(k)),
+            key=len,
+            default=None,
+        )
+        if best is None:
+            input_ids = encode(prompt, True)
+        elif len(best) == len(prompt):
+            input_ids = self._prefix_ids[best]
+        else:
+            input_ids = torch.cat(
+                [self._prefix_ids[best], encode(prompt[len(best):], False)], dim=1
+            )
+
+        self._prefix_ids[prompt] = input_ids
+        self._prefix_ids.move_to_end(prompt)
+        if best is not None:
+            self._prefix_ids.move_to_end(best)
+        while len(self._prefix_ids) > _PREFIX_CACHE_SIZE:
+            self._prefix_ids.popitem(last=False)
+
+        return input_ids[:, :_MAX_INPUT_TOKENS]
+
+    def _generate_local(
+        self,
+        prompt: str,
+        max_tokens: int,
+        temperature: float,
+        system_prefix: Optional[str] = None
+    ) -> str:
         """Generate using local model.
 
         Args:
             prompt: Input prompt
             max_tokens: Max tokens to generate
             temperature: Sampling temperature
+            system_prefix: Leading system section of the prompt (for token reuse)
 
         Returns:
             Generated text
         """
+        self._ensure_loaded()
         if not self.model or not self.tokenizer:
             raise RuntimeError("Model not loaded. Check initialization errors.")
 
         import torch
 
-        # Tokenize
-        inputs = self.tokenizer(prompt, return_tensors="pt", truncation=True, max_length=2048)
+        # Tokenize (prefix ids are reused across calls)
+        input_ids = self._encode_prompt(prompt, system_prefix)
+        inputs = {"input_ids": input_ids, "attention_mask": torch.ones_like(input_ids)}
 
         # Generate
-        with torch.no_grad():
+        with torch.inference_mode(), torch.autocast(
+            device_type="cpu",
+            dtype=torch.bfloat16,
+            enabled=self.quantization == "bf16"
+        ):
             outputs = self.model.generate(
                 **inputs,
                 max_new_tokens=max_tokens,
@@ -179,6 +324,116 @@ class LocalModelClient:
 
         return response
 
+    async def _generate_batched(
+        self,
+        prompt: str,
+        max_tokens: int,
+        temperature: float,
+        system_prefix: Optional[str] = None
+    ) -> str:
+        """Queue a prompt for the batch worker and wait for its result."""
+        if self._queue is None:
+            self._queue = asyncio.Queue()
+        if self._batch_worker is None or self._batch_worker.done():
+            self._batch_worker = asyncio.create_task(self._run_batch_worker())
+
+        future = asyncio.get_running_loop().create_future()
+        await self._queue.put((prompt, max_tokens, temperature, system_prefix, future))
+        return await future
+
+    async def _run_batch_worker(self):
+        """Collect requests arriving within a short window and generate them together."""
+        while True:
+            batch = [await self._queue.get()]
+            deadline = asyncio.get_running_loop().time() + _BATCH_WINDOW_SECONDS
+            while len(batch) < _BATCH_SIZE:
+                timeout = deadline - asyncio.get_running_loop().time()
+                if timeout <= 0:
+                    break
+                try:
+                    batch.append(await asyncio.wait_for(self._queue.get(), timeout))
+                except asyncio.TimeoutError:
+                    break
+
+            # generate() takes one set of sampling params — group by them
+            groups: Dict[tuple, list] = {}
+            for item in batch:
+                groups.setdefault((item[1], item[2]), []).append(item)
+
+            for (max_tokens, temperature), items in groups.items():
+                try:
+                    if len(items) == 1:
+                        prompt, _, _, system_prefix, _ = items[0]
+                        results = [await asyncio.to_thread(
+                            self._generate_local, prompt, max_tokens, temperature, system_prefix
+                        )]
+                    else:
+                        results = await asyncio.to_thread(
+                            self._generate_local_batch,
+                            [item[0] for item in items], max_tokens, temperature
+                        )
+                    for item, text in zip(items, results):
+                        if not item[4].done():
+                            item[4].set_result(text)
+                except Exception as e:
+                    for item in items:
+                        if not item[4].done():
+                            item[4].set_exception(e)
+
+    def _generate_local_batch(
+        self,
+        prompts: List[str],
+        max_tokens: int,
+        temperature: float
+    ) -> List[str]:
+        """Generate for several prompts in one left-padded generate() call.
+
+        Args:
+            prompts: Input prompts
+            max_tokens: Max tokens to generate
+            temperature: Sampling temperature
+
+        Returns:
+            Generated text per prompt, in order
+        """
+        self._ensure_loaded()
+        if not self.model or not self.tokenizer:
+            raise RuntimeError("Model not loaded. Check initialization errors.")
+
+        import torch
+
+        self.tokenizer.padding_side = "left"
+        if self.tokenizer.pad_token is None:
+            self.tokenizer.pad_token = self.tokenizer.eos_token
+
+        inputs = self.tokenizer(
+            prompts,
+            return_tensors="pt",
+            padding=True,
+            truncation=True,
+            max_length=_MAX_INPUT_TOKENS
+        )
+
+        with torch.inference_mode(), torch.autocast(
+            device_type="cpu",
+            dtype=torch.bfloat16,
+            enabled=self.quantization == "bf16"
+        ):
+            outputs = self.model.generate(
+                **inputs,
+                max_new_tokens=max_tokens,
+                temperature=temperature,
+                do_sample=temperature > 0,
+                pad_token_id=self.tokenizer.pad_token_id
+            )
+
+        # With left padding every prompt ends at the same column
+        new_tokens = outputs[:, inputs["input_ids"].shape[1]:]
+        return [
+            text.strip()
+            for text in self.tokenizer.batch_decode(new_tokens, skip_special_tokens=True)
+        ]
+
     async def _generate_via_endpoint(self, prompt: str, max_tokens: int, temperature: float) -> str:
         """Generate using remote endpoint (vLLM, Ollama, etc.).
 
@@ -199,21 +454,37 @@ class LocalModelClient:
                 "temperature": temperature
             }
 
-            response = requests.post(
+            session = await get_session()
+            async with session.post(
                 f"{self.endpoint}/v1/completions",
                 json=payload,
-                timeout=60
-            )
-            response.raise_for_status()
+                timeout=aiohttp.ClientTimeout(total=60)
+            ) as response:
+                response.raise_for_status()
+                result = await response.json(loads=orjson.loads)
 
-            result = response.json()
             return result["choices"][0]["text"].strip()
 
         except Exception as e:
             logger.error(f"Error calling endpoint {self.endpoint}: {e}")
             raise
 
-    def is_available(self) -> bool:
+    async def close(self):
+        """Stop the batch worker and fail any requests still queued."""
+        if self._batch_worker is not None:
+            self._batch_worker.cancel()
+            try:
+                await self._batch_worker
+            except asyncio.CancelledError:
+                pass
+            self._batch_worker = None
+        if self._queue is not None:
+            while not self._queue.empty():
+                future = self._queue.get_nowait()[-1]
+                if not future.done():
+                    future.cancel()
+
+    async def is_available(self) -> bool:
         """Check if local model is available.
 
         Returns:
@@ -221,8 +492,13 @@ class LocalModelClient:
         """
         if self.endpoint:
             try:
-                response = requests.get(f"{self.endpoint}/health", timeout=5)
-                return response.status_code == 200
-            except:
+                session = await get_session()
+                async with session.get(
+                    f"{self.endpoint}/health",
+                    timeout=aiohttp.ClientTimeout(total=5)
+                ) as response:
+                    return response.status == 200
+            except Exception:
                 return False
+        await asyncio.to_thread(self._ensure_loaded)
         return self.model is not None and self.tokenizer is not None
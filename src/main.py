@@ -25,11 +25,11 @@ from src.core.task_runner import TaskRunner
 from src.core.brain.working_memory import WorkingMemory
 from src.core.brain.episodic_memory import EpisodicMemory
 from src.core.brain.intent_data_collector import IntentDataCollector
+from src.core.brain.response_cache_store import ResponseCacheStore
 from src.core.brain.attention_engine import AttentionEngine
 from src.core.brain.critic_agent import CriticAgent
 from src.core.brain.reasoning_template_library import ReasoningTemplateLibrary
 from src.core.brain.nova_purpose import NovaPurpose
-from src.integrations.anthropic_client import AnthropicClient
 from src.integrations.model_router import ModelRouter
 from src.channels.telegram_channel import TelegramChannel
 from src.channels.twilio_whatsapp_channel import TwilioWhatsAppChannel
@@ -43,7 +43,7 @@ from src.core.self_healing.monitor import SelfHealingMonitor
 from src.core.memory_consolidator import MemoryConsolidator
 from src.utils.memory_backup import MemoryBackup
 from src.core.brain.semantic_router import SemanticRouter
-from src.utils.daily_digest import DailyDigest
+from src.utils.daily_digest import DailyDigest, install_activity_counter
 
 # Setup logging — file handler is best-effort (don't crash if permission denied)
 LOG_DIR = Path("data/logs")
@@ -61,6 +61,8 @@ logging.basicConfig(
     format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
     handlers=_log_handlers
 )
+# Count digest events as they're logged so /report needn't rescan agent.log
+install_activity_counter("./data")
 
 logger = logging.getLogger(__name__)
 
@@ -73,9 +75,12 @@ async def main():
         logger.info("Loading configuration...")
         config = load_config()
 
-        logger.info(f"🤖 Autonomous Claude Agent v1.0.0")
-        logger.info(f"Model: {config.default_model}")
-        logger.info(f"Self-build mode: {config.self_build_mode}")
+        if logger.isEnabledFor(logging.INFO):
+            logger.info("\n".join([
+                "🤖 Autonomous Claude Agent v1.0.0",
+                f"Model: {config.default_model}",
+                f"Self-build mode: {config.self_build_mode}",
+            ]))
 
         # Initialize appropriate brain
         if config.self_build_mode:
@@ -262,7 +267,9 @@ Models: Claude Opus/Sonnet/Haiku + SmolLM2 (local fallback)"""
         logger.info("🕐 ClockTool registered (PST)")
 
         # Initialize sub-agent spawner (share parent agent's tools for real capability)
-        api_client = AnthropicClient(config.api_key)
+        # Reuse the agent's client so intent, chat and agent calls share one
+        # keep-alive connection pool
+        api_client = agent.api_client
         agent_factory = AgentFactory(api_client, config)
         agent_factory.set_tools(agent.tools)  # Sub-agents inherit all registered tools
         orchestrator = Orchestrator(agent_factory)
@@ -282,34 +289,42 @@ Models: Claude Opus/Sonnet/Haiku + SmolLM2 (local fallback)"""
             config=auto_update_config
         )
 
-        logger.info("\n✅ All systems initialized!")
-        logger.info("\n" + "="*50)
-        logger.info("Implemented Components:")
-        logger.info("="*50)
-        logger.info("  ✓ Configuration system")
-        logger.info("  ✓ Anthropic API client")
-        logger.info("  ✓ Tool system (Bash, File, Web, Browser)")
-        logger.info("  ✓ Dual brain architecture (coreBrain + DigitalCloneBrain)")
-        logger.info("  ✓ Core agent execution loop")
-        logger.info("  ✓ Sub-agent spawning system")
-        logger.info("  ✓ Multi-agent orchestrator")
-        logger.info("  ✓ Auto-update system with vulnerability scanning")
-        logger.info("  ✓ Monitoring (Telegram + Dashboard)")
-        logger.info("\n" + "="*50)
-        logger.info("Still Needed:")
-        logger.info("="*50)
-        logger.info("  • Meta-agent self-builder")
-        logger.info("="*50)
-
-        # Demo mode
-        if config.self_build_mode:
-            logger.info("\n⚠️  Self-building meta-agent not yet implemented")
-            logger.info("📝 Next: Implement meta-agent that reads COMPLETE_GUIDE.md")
-        else:
-            logger.info("\n💡 Agent is ready! You can now:")
-            logger.info("   - Call agent.run(task) to execute tasks autonomously")
-            logger.info("   - Use orchestrator to spawn multiple sub-agents")
-            logger.info("   - Monitor via Telegram commands or web dashboard")
+        # Startup summary — one log record instead of one per line
+        if logger.isEnabledFor(logging.INFO):
+            lines = [
+                "\n✅ All systems initialized!",
+                "\n" + "="*50,
+                "Implemented Components:",
+                "="*50,
+                "  ✓ Configuration system",
+                "  ✓ Anthropic API client",
+                "  ✓ Tool system (Bash, File, Web, Browser)",
+                "  ✓ Dual brain architecture (coreBrain + DigitalCloneBrain)",
+                "  ✓ Core agent execution loop",
+                "  ✓ Sub-agent spawning system",
+                "  ✓ Multi-agent orchestrator",
+                "  ✓ Auto-update system with vulnerability scanning",
+                "  ✓ Monitoring (Telegram + Dashboard)",
+                "\n" + "="*50,
+                "Still Needed:",
+                "="*50,
+                "  • Meta-agent self-builder",
+                "="*50,
+            ]
+            # Demo mode
+            if config.self_build_mode:
+                lines += [
+                    "\n⚠️  Self-building meta-agent not yet implemented",
+                    "📝 Next: Implement meta-agent that reads COMPLETE_GUIDE.md",
+                ]
+            else:
+                lines += [
+                    "\n💡 Agent is ready! You can now:",
+                    "   - Call agent.run(task) to execute tasks autonomously",
+                    "   - Use orchestrator to spawn multiple sub-agents",
+                    "   - Monitor via Telegram commands or web dashboard",
+                ]
+            logger.info("\n".join(lines))
 
         # Initialize Telegram chat with webhooks (using new channel-agnostic architecture)
         telegram_chat = None
@@ -424,6 +439,8 @@ Models: Claude Opus/Sonnet/Haiku + SmolLM2 (local fallback)"""
                 golden_path="./data/golden_intents.json",
             )
             conversation_manager.intent_data_collector = intent_data_collector
+            # Intent/chat caches survive restarts (first messages after a restart stay warm)
+            conversation_manager.attach_cache_store(ResponseCacheStore(data_dir="./data"))
             # Wire memory sources into MemoryQueryTool (mid-task active memory reasoning)
             _llm_for_memory = gemini_client if 'gemini_client' in locals() and gemini_client else None
             agent.tools.set_memory_sources(brain=digital_brain, episodic_memory=episodic_memory, llm_client=_llm_for_memory)
@@ -493,6 +510,7 @@ Models: Claude Opus/Sonnet/Haiku + SmolLM2 (local fallback)"""
                 conversation_manager=conversation_manager,
                 webhook_url=webhook_url
             )
+            conversation_manager.reply_channel = telegram_chat
 
             # Initialize Twilio WhatsApp Channel
             twilio_whatsapp_channel = None
@@ -687,25 +705,34 @@ Models: Claude Opus/Sonnet/Haiku + SmolLM2 (local fallback)"""
         else:
             logger.info("🔍 AttentionEngine disabled (set ATTENTION_ENGINE_ENABLED=false to disable)")
 
-        # Show Telegram info
-        if telegram.enabled:
-            logger.info(f"\n📱 Telegram notifications enabled")
-            if telegram_chat:
-                logger.info("   💬 Chat interface: ACTIVE (webhooks)")
-                logger.info("   Send a message to your bot to start chatting!")
-            else:
-                logger.info("   Send /start to your bot to interact")
-
-        # Show auto-update info
-        if auto_updater.enabled:
-            logger.info(f"\n🔄 Auto-update enabled")
-            logger.info(f"   Security-only: {auto_updater.security_only}")
-            logger.info(f"   Schedule: {auto_update_config.get('schedule', 'daily')}")
-            logger.info(f"   Auto-restart: {auto_updater.auto_restart}")
-
-        # Keep running (for systemd service)
-        logger.info("\n✅ Agent initialized and ready!")
-        logger.info("Keeping process alive for systemd service...")
+        if logger.isEnabledFor(logging.INFO):
+            lines = []
+            # Show Telegram info
+            if telegram.enabled:
+                lines.append("\n📱 Telegram notifications enabled")
+                if telegram_chat:
+                    lines += [
+                        "   💬 Chat interface: ACTIVE (webhooks)",
+                        "   Send a message to your bot to start chatting!",
+                    ]
+                else:
+                    lines.append("   Send /start to your bot to interact")
+
+            # Show auto-update info
+            if auto_updater.enabled:
+                lines += [
+                    "\n🔄 Auto-update enabled",
+                    f"   Security-only: {auto_updater.security_only}",
+                    f"   Schedule: {auto_update_config.get('schedule', 'daily')}",
+                    f"   Auto-restart: {auto_updater.auto_restart}",
+                ]
+
+            # Keep running (for systemd service)
+            lines += [
+                "\n✅ Agent initialized and ready!",
+                "Keeping process alive for systemd service...",
+            ]
+            logger.info("\n".join(lines))
 
         # Start reminder scheduler background task
         # Pass task_queue so action reminders (post, send, call, etc.) are executed, not just notified
@@ -793,10 +820,16 @@ Models: Claude Opus/Sonnet/Haiku + SmolLM2 (local fallback)"""
                 attention_task.cancel()
             if 'pattern_task' in locals() and pattern_task:
                 pattern_task.cancel()
+            if 'conversation_manager' in locals() and conversation_manager:
+                await conversation_manager.shutdown()
             # Shutdown MCP server connections
             if hasattr(agent.tools, 'shutdown_mcp'):
                 await agent.tools.shutdown_mcp()
+            # Close pooled HTTP connections
+            from src.core.http_session import close_session
+            await close_session()
             await telegram.notify("Agent shutting down", level="warning")
+            await telegram.flush()
 
     except Exception as e:
         logger.error(f"Fatal error: {e}", exc_info=True)
@@ -0,0 +1,144 @@
+"""AIMD admission control for outbound provider calls.
+
+Caps concurrent in-flight requests per provider and adapts the cap:
+additive increase while calls are fast and succeed, multiplicative
+decrease on slow calls, 429s, or an exhausted rate-limit budget.
+Callers share one controller per provider via `get_admission(name)`.
+
+Usage:
+    admission = get_admission("anthropic", target_latency=30.0)
+    async with admission.slot():
+        response = await call_provider()
+"""
+
+import asyncio
+import logging
+import time
+from collections import deque
+from contextlib import asynccontextmanager
+from typing import Dict, Mapping, Optional
+
+logger = logging.getLogger(__name__)
+
+_DEFAULT_RETRY_AFTER = 1.0  # seconds, when a 429 carries no Retry-After
+_MAX_RETRY_AFTER = 60.0
+_DECREASE_COOLDOWN = 1.0  # Don't shrink more than once per second
+
+_controllers: Dict[str, "Admission"] = {}
+
+
+class Admission:
+    """Adaptive concurrency limit (AIMD) for one provider."""
+
+    def __init__(
+        self,
+        name: str,
+        initial: float = 8.0,
+        min_limit: float = 1.0,
+        max_limit: float = 64.0,
+        alpha: float = 0.5,
+        beta: float = 0.5,
+        target_latency: float = 10.0,
+        window: int = 50,
+    ):
+        """Initialize the controller.
+
+        Args:
+            name: Provider name (for logging)
+            initial: Starting concurrency limit
+            min_limit: Floor for the limit
+            max_limit: Ceiling for the limit
+            alpha: Additive increase per healthy response
+            beta: Multiplicative decrease factor on overload
+            target_latency: Seconds; slower responses count as overload
+            window: Number of recent latencies kept for stats
+        """
+        self.name = name
+        self.limit = initial
+        self.min_limit = min_limit
+        self.max_limit = max_limit
+        self.alpha = alpha
+        self.beta = beta
+        self.target_latency = target_latency
+        self.latencies: deque = deque(maxlen=window)
+        self._in_flight = 0
+        self._cond = asyncio.Condition()
+        self._last_decrease = 0.0
+
+    @property
+    def in_flight(self) -> int:
+        return self._in_flight
+
+    @asynccontextmanager
+    async def slot(self):
+        """Wait for a free slot, then hold it for the duration of the call.
+
+        Latency is recorded and the limit adjusted when the block exits
+        without an exception. Callers report 429s via `decrease()`.
+        """
+        async with self._cond:
+            await self._cond.wait_for(lambda: self._in_flight < int(self.limit))
+            self._in_flight += 1
+        start = time.monotonic()
+        ok = False
+        try:
+            yield self
+            ok = True
+        finally:
+            if ok:
+                self.record(time.monotonic() - start)
+            async with self._cond:
+                self._in_flight -= 1
+                self._cond.notify_all()
+
+    def record(self, latency: float):
+        """Record a successful call's latency and adjust the limit."""
+        self.latencies.append(latency)
+        if latency <= self.target_latency:
+            self.increase()
+        else:
+            self.decrease()
+
+    def increase(self):
+        """Additive increase."""
+        self.limit = min(self.max_limit, self.limit + self.alpha)
+
+    def decrease(self):
+        """Multiplicative decrease (at most once per cooldown)."""
+        now = time.monotonic()
+        if now - self._last_decrease < _DECREASE_COOLDOWN:
+            return
+        self._last_decrease = now
+        old = self.limit
+        self.limit = max(self.min_limit, self.limit * self.beta)
+        logger.info(f"{self.name} admission limit {old:.1f} -> {self.limit:.1f}")
+
+    def observe_headers(self, headers: Optional[Mapping[str, str]]):
+        """Shrink early when rate-limit headers show the budget is exhausted."""
+        if not headers:
+            return
+        remaining = headers.get("anthropic-ratelimit-requests-remaining")
+        try:
+            if remaining is not None and int(remaining) <= 0:
+                self.decrease()
+        except ValueError:
+            pass
+
+
+def retry_after(headers: Optional[Mapping[str, str]], default: float = _DEFAULT_RETRY_AFTER) -> float:
+    """Parse a Retry-After header (seconds form) into a bounded delay."""
+    value = headers.get("retry-after") if headers else None
+    try:
+        delay = float(value) if value is not None else default
+    except ValueError:
+        delay = default
+    return max(0.0, min(delay, _MAX_RETRY_AFTER))
+
+
+def get_admission(name: str, **kwargs) -> Admission:
+    """Return the shared controller for a provider, creating it on first use."""
+    controller = _controllers.get(name)
+    if controller is None:
+        controller = Admission(name, **kwargs)
+        _controllers[name] = controller
+    return controller
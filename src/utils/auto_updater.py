@@ -1,17 +1,174 @@
 """Automatic update system for keeping packages secure and up-to-date."""
 
 import asyncio
+import ctypes
+import ctypes.util
+import hashlib
+import importlib.metadata
 import logging
 import json
-from typing import List, Dict, Any, Optional
+import os
+import re
+import select
+import shlex
+import sys
+import time
+from collections import defaultdict, deque
+from dataclasses import asdict
+from typing import List, Dict, Any, Optional, Tuple
 from datetime import datetime, timedelta
 from pathlib import Path
 
+from packaging.version import InvalidVersion, Version
+
+from ..core.types import ToolResult
+from .scheduling import next_daily, sleep_until
 from .vulnerability_scanner import VulnerabilityScanner, Vulnerability
 from .telegram_notifier import TelegramNotifier
 
 logger = logging.getLogger(__name__)
 
+# "Successfully installed pkg-1.0 other-2.3" line from pip
+_PIP_INSTALLED_RE = re.compile(r"^Successfully installed (.+)$", re.MULTILINE)
+
+
+def _pip_spec(vuln: Vulnerability) -> str:
+    """Requirement spec that fixes a vulnerability (pinned when a fix is known)."""
+    return f"{vuln.package}=={vuln.fixed_version}" if vuln.fixed_version else vuln.package
+
+
+def _already_fixed(vuln: Vulnerability) -> bool:
+    """True if the installed version is at or past the vulnerability's fixed version.
+
+    Checked before pip runs: `pkg==fixed --upgrade` would otherwise downgrade
+    a package that is already newer than the fix.
+    """
+    if not vuln.fixed_version:
+        return False
+    try:
+        installed = importlib.metadata.version(vuln.package)
+        return Version(installed) >= Version(vuln.fixed_version)
+    except (importlib.metadata.PackageNotFoundError, InvalidVersion):
+        return False
+
+
+def _canonical_name(name: str) -> str:
+    """PEP 503 normalized project name."""
+    return re.sub(r"[-_.]+", "-", name).lower()
+
+
+def _installed_fingerprint() -> str:
+    """Hash of installed distribution names + versions (cheap pip freeze stand-in)."""
+    entries = sorted(
+        f"{d.metadata['Name']}=={d.version}\n"
+        for d in importlib.metadata.distributions()
+    )
+    return hashlib.blake2b("".join(entries).encode(), digest_size=16).hexdigest()
+
+
+# inotify(7) constants from <sys/inotify.h>
+_IN_MODIFY = 0x002
+_IN_ATTRIB = 0x004
+_IN_CLOSE_WRITE = 0x008
+_IN_DELETE_SELF = 0x400
+_IN_MOVE_SELF = 0x800
+_IN_NONBLOCK = os.O_NONBLOCK
+_IN_CLOEXEC = 0o2000000
+_IN_MASK = _IN_MODIFY | _IN_ATTRIB | _IN_CLOSE_WRITE | _IN_DELETE_SELF | _IN_MOVE_SELF
+
+_ENV_POLL_SECONDS = 30  # Fallback when neither inotify nor kqueue is available
+_NOTIFY_DEBOUNCE_SECONDS = 0.5  # Notifications within this window go out as one message
+_REMOTE_SHA_TTL_SECONDS = 60  # Reuse the ls-remote result for back-to-back checks
+_HISTORY_KEEP = 50  # Update history entries kept in memory
+_HISTORY_MAX_BYTES = 1024 * 1024  # Rotate the history file past this size
+_SCAN_CACHE_MAX_AGE = timedelta(hours=6)  # Reuse scan results this long if packages are unchanged
+
+
+class _FileWatch:
+    """Kernel change notification for one file (inotify on Linux, kqueue on BSD/macOS).
+
+    `wait()` blocks on the event loop's reader until the kernel reports a
+    write, attribute change, rename or delete — no periodic wakeups.
+    """
+
+    def __init__(self, fd: int, drain, close):
+        self.fd = fd
+        self._drain = drain
+        self._close = close
+
+    @classmethod
+    def open(cls, path: Path) -> Optional["_FileWatch"]:
+        """Start watching `path`, or return None if the platform can't."""
+        try:
+            if sys.platform.startswith("linux"):
+                return cls._open_inotify(path)
+            if hasattr(select, "kqueue"):
+                return cls._open_kqueue(path)
+        except (OSError, AttributeError) as e:
+            logger.debug(f"File watch unavailable for {path}: {e}")
+        return None
+
+    @classmethod
+    def _open_inotify(cls, path: Path) -> Optional["_FileWatch"]:
+        libc = ctypes.CDLL(ctypes.util.find_library("c") or "libc.so.6", use_errno=True)
+        fd = libc.inotify_init1(_IN_NONBLOCK | _IN_CLOEXEC)
+        if fd < 0:
+            raise OSError(ctypes.get_errno(), "inotify_init1 failed")
+        if libc.inotify_add_watch(fd, os.fsencode(path), _IN_MASK) < 0:
+            errno = ctypes.get_errno()
+            os.close(fd)
+            raise OSError(errno, "inotify_add_watch failed")
+
+        def drain():
+            try:
+                while os.read(fd, 4096):
+                    pass
+            except BlockingIOError:
+                pass
+
+        return cls(fd, drain, lambda: os.close(fd))
+
+    @classmethod
+    def _open_kqueue(cls, path: Path) -> Optional["_FileWatch"]:
+        file_fd = os.open(path, getattr(os, "O_EVTONLY", os.O_RDONLY))
+        kq = select.kqueue()
+        try:
+            kq.control([select.kevent(
+                file_fd,
+                filter=select.KQ_FILTER_VNODE,
+                flags=select.KQ_EV_ADD | select.KQ_EV_CLEAR,
+                fflags=(select.KQ_NOTE_WRITE | select.KQ_NOTE_ATTRIB
+                        | select.KQ_NOTE_DELETE | select.KQ_NOTE_RENAME),
+            )], 0)
+        except OSError:
+            kq.close()
+            os.close(file_fd)
+            raise
+
+        def close():
+            kq.close()
+            os.close(file_fd)
+
+        return cls(kq.fileno(), lambda: kq.control(None, 8, 0), close)
+
+    async def wait(self):
+        """Wait until the kernel reports a change to the watched file."""
+        loop = asyncio.get_running_loop()
+        changed = asyncio.Event()
+
+        def on_readable():
+            self._drain()
+            changed.set()
+
+        loop.add_reader(self.fd, on_readable)
+        try:
+            await changed.wait()
+        finally:
+            loop.remove_reader(self.fd)
+
+    def close(self):
+        self._close()
+
 
 class AutoUpdater:
     """Manages automatic updates for Python and system packages."""
@@ -41,15 +198,30 @@ class AutoUpdater:
         self.notify_telegram = self.config.get("notify_telegram", True)
         self.update_system = self.config.get("packages", {}).get("system", True)
         self.update_python = self.config.get("packages", {}).get("python", True)
+        self.check_hour = self.config.get("check_hour", 3)  # Daily check time (USER_TZ)
 
         # Backup tracking
         self.backup_dir = Path("data/update_backups")
         self.backup_dir.mkdir(parents=True, exist_ok=True)
 
-        # Update history
-        self.update_history: List[Dict[str, Any]] = []
+        # Update history (append-only JSONL, most recent entries kept in memory)
+        self.history_file = self.backup_dir / "update_history.jsonl"
+        self.update_history: List[Dict[str, Any]] = self._load_history()
         self.last_update = None
 
+        # Debounced notifications, coalesced per level
+        self._pending: Dict[str, List[str]] = defaultdict(list)
+        self._flush_task: Optional[asyncio.Task] = None
+        self._flush_lock = asyncio.Lock()
+
+        # The git check and the package scan run concurrently; these keep
+        # their pip installs from overlapping and a restart from cutting a pull short
+        self._pip_lock = asyncio.Lock()
+        self._git_lock = asyncio.Lock()
+
+        # (origin/main SHA, monotonic time fetched) from the last ls-remote
+        self._remote_sha: Optional[Tuple[str, float]] = None
+
         logger.info(f"AutoUpdater initialized (enabled={self.enabled})")
 
     async def run_daily_update_check(self):
@@ -61,13 +233,21 @@ class AutoUpdater:
         logger.info("🔍 Starting daily update check...")
 
         try:
-            # 1. Scan for vulnerabilities (silent — only notify if issues found)
-            python_vulns = await self.scanner.scan_python_packages()
+            # 1. Scan for vulnerabilities (silent — only notify if issues found).
+            # A recent pip-audit of the same package set is reused (e.g. right after
+            # a restart). System updates aren't covered by the fingerprint, so the
+            # package manager is always asked.
+            fingerprint = _installed_fingerprint()
+            cached = self._load_scan_cache(fingerprint)
+            if cached:
+                python_vulns, summary = cached
+            else:
+                python_vulns = await self.scanner.scan_python_packages()
+                # 2. Get scan summary
+                summary = self.scanner.get_scan_summary()
+                self._save_scan_cache(fingerprint, python_vulns, summary)
             system_updates = await self.scanner.scan_system_packages()
 
-            # 2. Get scan summary
-            summary = self.scanner.get_scan_summary()
-
             # 3. Notify about findings
             await self._send_scan_report(summary, python_vulns, system_updates)
 
@@ -80,6 +260,10 @@ class AutoUpdater:
             if self.update_system and system_updates:
                 updates_applied |= await self._update_system_packages(system_updates)
 
+            # The cached scan predates these updates
+            if updates_applied:
+                self._clear_scan_cache()
+
             # 5. Restart if needed and updates were applied
             if updates_applied and self.auto_restart:
                 await self._restart_agent()
@@ -94,6 +278,63 @@ class AutoUpdater:
             logger.error(f"Error during auto-update: {e}", exc_info=True)
             await self._notify(f"❌ Auto-update failed: {str(e)}", "error")
 
+    def _load_scan_cache(
+        self, fingerprint: str
+    ) -> Optional[Tuple[List[Vulnerability], Dict[str, Any]]]:
+        """Return the cached Python scan results if they match the installed packages.
+
+        An empty result is a valid hit — a clean scan is worth caching too.
+
+        Args:
+            fingerprint: Current installed-package fingerprint
+
+        Returns:
+            (python vulnerabilities, scan summary), or None on a miss
+        """
+        cache_file = self.backup_dir / ".scan_cache.json"
+        try:
+            cache = json.loads(cache_file.read_text())
+            scanned_at = datetime.fromisoformat(cache["scanned_at"])
+            if cache["fp"] != fingerprint or datetime.now() - scanned_at > _SCAN_CACHE_MAX_AGE:
+                return None
+            python_vulns = [Vulnerability(**v) for v in cache["python_vulns"]]
+            summary = cache["summary"]
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError, KeyError, TypeError) as e:
+            logger.debug(f"Ignoring unreadable scan cache: {e}")
+            return None
+
+        # Restore scanner state so get_status() reflects it
+        self.scanner.vulnerabilities = python_vulns
+        self.scanner.last_scan = scanned_at
+        logger.info(f"Installed packages unchanged since {scanned_at:%H:%M}, reusing scan results")
+        return python_vulns, summary
+
+    def _save_scan_cache(
+        self,
+        fingerprint: str,
+        python_vulns: List[Vulnerability],
+        summary: Dict[str, Any]
+    ):
+        """Persist Python scan results keyed by the installed-package fingerprint."""
+        try:
+            (self.backup_dir / ".scan_cache.json").write_text(json.dumps({
+                "fp": fingerprint,
+                "scanned_at": datetime.now().isoformat(),
+                "python_vulns": [asdict(v) for v in python_vulns],
+                "summary": summary,
+            }, separators=(",", ":")))
+        except (OSError, TypeError) as e:
+            logger.error(f"Error saving scan cache: {e}")
+
+    def _clear_scan_cache(self):
+        """Drop the cached scan so the next check rescans."""
+        try:
+            (self.backup_dir / ".scan_cache.json").unlink(missing_ok=True)
+        except OSError as e:
+            logger.error(f"Error clearing scan cache: {e}")
+
     async def _update_python_packages(self, vulnerabilities: List[Vulnerability]) -> bool:
         """Update vulnerable Python packages.
 
@@ -117,37 +358,60 @@ class AutoUpdater:
             logger.info("No critical/high vulnerabilities to fix")
             return False
 
-        # Create backup of current requirements
-        await self._backup_requirements()
+        # pip runs from the git check and from here may overlap — one at a time
+        async with self._pip_lock:
+            # Drop packages already at or past a fixed version (e.g. upgraded by
+            # hand); pinning those would downgrade them
+            fixed = [v.package for v in to_update if _already_fixed(v)]
+            if fixed:
+                logger.info(f"Already at a fixed version, skipping: {', '.join(fixed)}")
+                to_update = [v for v in to_update if v.package not in fixed]
+                if not to_update:
+                    return False
+
+            pending = await self._pending_installs(to_update)
+            if pending is not None:
+                satisfied = [v.package for v in to_update if _canonical_name(v.package) not in pending]
+                if satisfied:
+                    logger.info(f"Already satisfied, skipping: {', '.join(satisfied)}")
+                to_update = [v for v in to_update if _canonical_name(v.package) in pending]
+                if not to_update:
+                    return False
 
-        updated_packages = []
-        failed_packages = []
+            # Create backup of current requirements
+            await self._backup_requirements()
 
-        for vuln in to_update:
-            try:
-                # Determine version to install
-                if vuln.fixed_version:
-                    install_spec = f"{vuln.package}=={vuln.fixed_version}"
-                else:
-                    install_spec = f"{vuln.package} --upgrade"
+            # One pip invocation for the whole set — a single resolver pass
+            updated_packages, failed_packages = await self._update_batch(to_update)
 
-                logger.info(f"Updating {vuln.package}: {vuln.installed_version} -> {vuln.fixed_version or 'latest'}")
+            if failed_packages:
+                # Batch failed as a whole (pip installs atomically) — retry per package
+                # so one unresolvable package doesn't block the rest.
+                # Pinned upgrades run concurrently (pip_concurrency); unpinned upgrades
+                # may pull in shared dependencies and race on site-packages, so go serial
+                concurrency = self.config.get("pip_concurrency", 4)
+                if any(not v.fixed_version for v in to_update):
+                    concurrency = 1
+                sem = asyncio.Semaphore(concurrency)
 
-                result = await self.bash_tool.execute(
-                    f"pip install --upgrade {install_spec}",
-                    timeout=180
-                )
+                async def bounded(vuln: Vulnerability):
+                    async with sem:
+                        return await self._update_one(vuln)
 
-                if result.success:
-                    updated_packages.append(vuln.package)
-                    logger.info(f"✅ Updated {vuln.package}")
-                else:
-                    failed_packages.append(vuln.package)
-                    logger.error(f"❌ Failed to update {vuln.package}: {result.error}")
+                results = await asyncio.gather(
+                    *(bounded(v) for v in to_update), return_exceptions=True
+                )
 
-            except Exception as e:
-                logger.error(f"Error updating {vuln.package}: {e}")
-                failed_packages.append(vuln.package)
+                updated_packages = []
+                failed_packages = []
+                for vuln, result in zip(to_update, results):
+                    if isinstance(result, Exception):
+                        logger.error(f"Error updating {vuln.package}: {result}")
+                        failed_packages.append(vuln.package)
+                    elif result[1]:
+                        updated_packages.append(result[0])
+                    else:
+                        failed_packages.append(result[0])
 
         # Record update
         self._record_update({
@@ -174,6 +438,125 @@ class AutoUpdater:
 
         return len(updated_packages) > 0
 
+    async def _pending_installs(self, to_update: List[Vulnerability]) -> Optional[set]:
+        """Ask pip which of the packages an upgrade would actually install.
+
+        Uses `pip install --dry-run --report -` (pip >= 22.2).
+
+        Args:
+            to_update: Vulnerabilities to fix
+
+        Returns:
+            Canonical names pip would install, or None if pip can't report
+        """
+        result = await self._exec(
+            ["pip", "install", "--upgrade", "--dry-run", "--quiet", "--report", "-",
+             *(_pip_spec(v) for v in to_update)],
+            timeout=120
+        )
+        if not result.success:
+            logger.debug(f"pip dry run unavailable, installing everything: {result.error}")
+            return None
+        try:
+            report = json.loads(result.output)
+            return {_canonical_name(item["metadata"]["name"]) for item in report["install"]}
+        except (ValueError, KeyError, TypeError) as e:
+            logger.debug(f"Unreadable pip dry-run report, installing everything: {e}")
+            return None
+
+    async def _update_batch(self, to_update: List[Vulnerability]) -> Tuple[List[str], List[str]]:
+        """Upgrade all packages with a single pip invocation.
+
+        Args:
+            to_update: Vulnerabilities to fix
+
+        Returns:
+            (updated package names, failed package names)
+        """
+        specs = [_pip_spec(v) for v in to_update]
+        names = [v.package for v in to_update]
+        logger.info(f"Updating {len(specs)} packages in one pip run: {', '.join(specs)}")
+
+        try:
+            result = await self._exec(
+                ["pip", "install", "--upgrade", *specs],
+                timeout=180 + 30 * len(specs)
+            )
+        except Exception as e:
+            logger.error(f"Error running batched pip install: {e}")
+            return [], names
+
+        if not result.success:
+            logger.error(f"❌ Batched pip install failed: {result.error}")
+            return [], names
+
+        match = _PIP_INSTALLED_RE.search(result.output or "")
+        installed = match.group(1).split() if match else []
+        logger.info(f"✅ pip installed: {', '.join(installed) or 'nothing new (already satisfied)'}")
+        # pip succeeded, so every requested spec is now satisfied
+        return names, []
+
+    async def _update_one(self, vuln: Vulnerability) -> Tuple[str, bool]:
+        """Upgrade a single vulnerable package.
+
+        Args:
+            vuln: Vulnerability to fix
+
+        Returns:
+            (package name, whether the upgrade succeeded)
+        """
+        install_spec = _pip_spec(vuln)
+
+        logger.info(f"Updating {vuln.package}: {vuln.installed_version} -> {vuln.fixed_version or 'latest'}")
+
+        result = await self._exec(["pip", "install", "--upgrade", install_spec], timeout=180)
+
+        if result.success:
+            logger.info(f"✅ Updated {vuln.package}")
+            return vuln.package, True
+
+        logger.error(f"❌ Failed to update {vuln.package}: {result.error}")
+        return vuln.package, False
+
+    async def _exec(self, argv: List[str], timeout: float) -> ToolResult:
+        """Run a fixed command directly (no shell) and capture its output.
+
+        For the updater's own pip/git invocations, which need no shell
+        features. sudo commands still go through bash_tool so its sudo
+        policy applies.
+
+        Args:
+            argv: Program and arguments
+            timeout: Timeout in seconds
+
+        Returns:
+            ToolResult with stdout as output and stderr as error
+        """
+        logger.info(f"Executing: {shlex.join(argv)}")
+        try:
+            proc = await asyncio.create_subprocess_exec(
+                *argv,
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.PIPE,
+            )
+        except OSError as e:
+            return ToolResult(success=False, error=f"Could not run {argv[0]}: {e}")
+
+        try:
+            stdout, stderr = await asyncio.wait_for(proc.communicate(), timeout=timeout)
+        except asyncio.TimeoutError:
+            proc.kill()
+            await proc.wait()
+            return ToolResult(success=False, error=f"Command timed out after {timeout} seconds")
+
+        stderr_str = stderr.decode('utf-8', errors='replace') if stderr else ""
+        return ToolResult(
+            success=proc.returncode == 0,
+            output=stdout.decode('utf-8', errors='replace') if stdout else "",
+            error=stderr_str or None,
+            metadata={"return_code": proc.returncode}
+        )
+
     async def _update_system_packages(self, updates: List[Dict[str, str]]) -> bool:
         """Update system packages.
 
@@ -222,14 +605,36 @@ class AutoUpdater:
             return False
 
     async def _backup_requirements(self):
-        """Backup current pip requirements before updating."""
+        """Backup current pip requirements before updating.
+
+        Skipped when the installed package set is unchanged since the last
+        backup — that backup is still accurate and pip freeze is slow.
+        """
         try:
-            result = await self.bash_tool.execute("pip freeze")
+            fp_file = self.backup_dir / ".last_fp"
+            fingerprint = _installed_fingerprint()
+            if fp_file.exists() and fp_file.read_text().strip() == fingerprint:
+                logger.debug("Installed packages unchanged since last backup, skipping")
+                return
+
+            backup_file = self.backup_dir / f"requirements_{datetime.now().strftime('%Y%m%d_%H%M%S')}.txt"
+
+            # pip writes straight into the backup file — no shell, no buffered copy
+            with open(backup_file, 'wb') as out:
+                proc = await asyncio.create_subprocess_exec(
+                    "pip", "freeze",
+                    stdout=out,
+                    stderr=asyncio.subprocess.PIPE,
+                )
+                _, stderr = await proc.communicate()
 
-            if result.success:
-                backup_file = self.backup_dir / f"requirements_{datetime.now().strftime('%Y%m%d_%H%M%S')}.txt"
-                backup_file.write_text(result.output)
+            if proc.returncode == 0:
+                fp_file.write_text(fingerprint)
                 logger.info(f"Backed up requirements to {backup_file}")
+            else:
+                # Don't leave a truncated backup behind
+                backup_file.unlink(missing_ok=True)
+                logger.error(f"pip freeze failed: {stderr.decode(errors='replace').strip()}")
 
         except Exception as e:
             logger.error(f"Error backing up requirements: {e}")
@@ -239,10 +644,16 @@ class AutoUpdater:
         logger.info("Restarting agent after updates...")
 
         await self._notify("🔄 Restarting agent to apply updates...", "info")
+        await self._flush_now()
+
+        # Let an in-progress git pull finish first
+        async with self._git_lock:
+            pass
 
         try:
-            # Give time for notification to be sent
-            await asyncio.sleep(2)
+            # Notifications are queued; wait for them to be sent
+            if self.telegram:
+                await self.telegram.flush()
 
             # Restart via systemd
             result = await self.bash_tool.execute(
@@ -304,6 +715,18 @@ class AutoUpdater:
 
         await self._notify(message, "info")
 
+    def _load_history(self) -> List[Dict[str, Any]]:
+        """Load the most recent update history entries from disk."""
+        if not self.history_file.exists():
+            return []
+        try:
+            with open(self.history_file) as f:
+                tail = deque(f, maxlen=_HISTORY_KEEP)
+            return [json.loads(line) for line in tail if line.strip()]
+        except (OSError, json.JSONDecodeError) as e:
+            logger.warning(f"Could not load update history: {e}")
+            return []
+
     def _record_update(self, update_info: Dict[str, Any]):
         """Record update in history.
 
@@ -313,29 +736,49 @@ class AutoUpdater:
         self.update_history.append(update_info)
 
         # Keep only last 50 updates
-        if len(self.update_history) > 50:
-            self.update_history = self.update_history[-50:]
+        if len(self.update_history) > _HISTORY_KEEP:
+            self.update_history = self.update_history[-_HISTORY_KEEP:]
 
-        # Save to file
+        # Append to file; rotate once it grows past the size cap
         try:
-            history_file = self.backup_dir / "update_history.json"
-            with open(history_file, 'w') as f:
-                json.dump(self.update_history, f, indent=2)
+            if self.history_file.exists() and self.history_file.stat().st_size > _HISTORY_MAX_BYTES:
+                self.history_file.replace(self.history_file.with_suffix(".jsonl.1"))
+            with open(self.history_file, 'a') as f:
+                f.write(json.dumps(update_info, separators=(",", ":")) + "\n")
         except Exception as e:
             logger.error(f"Error saving update history: {e}")
 
     async def _notify(self, message: str, level: str = "info"):
-        """Send notification via Telegram.
+        """Queue a notification; messages within the debounce window are sent together.
 
         Args:
             message: Message to send
             level: Notification level
         """
-        if self.notify_telegram and self.telegram and self.telegram.enabled:
-            try:
-                await self.telegram.notify(message, level=level)
-            except Exception as e:
-                logger.error(f"Error sending Telegram notification: {e}")
+        if not (self.notify_telegram and self.telegram and self.telegram.enabled):
+            return
+
+        self._pending[level].append(message)
+        if self._flush_task is None or self._flush_task.done():
+            self._flush_task = asyncio.create_task(self._flush_after(_NOTIFY_DEBOUNCE_SECONDS))
+
+    async def _flush_after(self, delay: float):
+        await asyncio.sleep(delay)
+        await self._flush_now()
+
+    async def _flush_now(self):
+        """Send all queued notifications immediately, one message per level."""
+        async with self._flush_lock:
+            pending, self._pending = self._pending, defaultdict(list)
+            # Levels go out concurrently over the notifier's pooled connection
+            results = await asyncio.gather(
+                *(self.telegram.notify("\n\n".join(messages), level=level)
+                  for level, messages in pending.items()),
+                return_exceptions=True
+            )
+            for result in results:
+                if isinstance(result, Exception):
+                    logger.error(f"Error sending Telegram notification: {result}")
 
     async def check_git_updates(self) -> bool:
         """Check for updates from git repository and pull if available.
@@ -343,24 +786,37 @@ class AutoUpdater:
         Returns:
             True if updates were pulled
         """
+        async with self._git_lock:
+            return await self._check_git_updates()
+
+    async def _check_git_updates(self) -> bool:
         logger.info("🔍 Checking for git updates...")
 
         try:
             # Check if we're in a git repository
-            result = await self.bash_tool.execute("git rev-parse --git-dir", timeout=5)
+            result = await self._exec(["git", "rev-parse", "--git-dir"], timeout=5)
             if not result.success:
                 logger.warning("Not in a git repository, skipping git auto-update")
                 return False
 
+            # Compare SHAs first — ls-remote is one small round-trip, while
+            # fetch transfers pack data even when nothing new is worth pulling
+            remote_sha = await self._get_remote_sha()
+            if remote_sha:
+                result = await self._exec(["git", "rev-parse", "HEAD"], timeout=5)
+                if result.success and result.output.strip() == remote_sha:
+                    logger.info("Repository is up-to-date")
+                    return False
+
             # Fetch latest from remote
-            result = await self.bash_tool.execute("git fetch origin main", timeout=30)
+            result = await self._exec(["git", "fetch", "origin", "main"], timeout=30)
             if not result.success:
                 logger.error(f"Failed to fetch from git: {result.error}")
                 return False
 
             # Check if we're behind
-            result = await self.bash_tool.execute(
-                "git rev-list HEAD..origin/main --count",
+            result = await self._exec(
+                ["git", "rev-list", "HEAD..origin/main", "--count"],
                 timeout=5
             )
 
@@ -376,16 +832,14 @@ class AutoUpdater:
                 # Reset any local modifications to tracked files before pulling.
                 # Self-build or SCP may have modified tracked files — git is the
                 # source of truth, so we discard local diffs to avoid merge conflicts.
-                dirty = await self.bash_tool.execute(
-                    "git diff --name-only", timeout=5
-                )
+                dirty = await self._exec(["git", "diff", "--name-only"], timeout=5)
                 if dirty.success and dirty.output.strip():
                     dirty_files = dirty.output.strip().split("\n")
                     logger.info(f"Resetting {len(dirty_files)} locally modified files before pull: {dirty_files}")
-                    await self.bash_tool.execute("git checkout -- .", timeout=10)
+                    await self._exec(["git", "checkout", "--", "."], timeout=10)
 
                 # Pull the updates
-                result = await self.bash_tool.execute("git pull origin main", timeout=60)
+                result = await self._exec(["git", "pull", "origin", "main"], timeout=60)
 
                 if result.success:
                     await self._notify(
@@ -394,8 +848,8 @@ class AutoUpdater:
                     )
 
                     # Check if requirements.txt changed
-                    result = await self.bash_tool.execute(
-                        "git diff HEAD@{1} HEAD -- requirements.txt",
+                    result = await self._exec(
+                        ["git", "diff", "HEAD@{1}", "HEAD", "--", "requirements.txt"],
                         timeout=5
                     )
 
@@ -406,10 +860,11 @@ class AutoUpdater:
                             "info"
                         )
 
-                        result = await self.bash_tool.execute(
-                            "pip install -r requirements.txt --upgrade",
-                            timeout=300
-                        )
+                        async with self._pip_lock:
+                            result = await self._exec(
+                                ["pip", "install", "-r", "requirements.txt", "--upgrade"],
+                                timeout=300
+                            )
 
                         if result.success:
                             await self._notify("✅ Dependencies updated successfully", "success")
@@ -436,6 +891,25 @@ class AutoUpdater:
             await self._notify(f"❌ Git update check failed: {str(e)}", "error")
             return False
 
+    async def _get_remote_sha(self) -> Optional[str]:
+        """Return origin/main's SHA via `git ls-remote`, cached briefly.
+
+        Returns:
+            The remote SHA, or None if it couldn't be determined
+        """
+        now = time.monotonic()
+        if self._remote_sha and now - self._remote_sha[1] < _REMOTE_SHA_TTL_SECONDS:
+            return self._remote_sha[0]
+
+        result = await self._exec(["git", "ls-remote", "origin", "main"], timeout=10)
+        fields = result.output.split() if result.success and result.output else []
+        if not fields:
+            logger.debug(f"git ls-remote gave no SHA, falling back to fetch: {result.error}")
+            return None
+
+        self._remote_sha = (fields[0], now)
+        return fields[0]
+
     async def watch_env_file(self):
         """Watch .env file for changes and auto-restart when modified."""
         env_file = Path(".env")
@@ -448,8 +922,14 @@ class AutoUpdater:
         logger.info("👀 Watching .env file for changes...")
 
         while True:
+            # Re-arm each round: editors often save by replacing the file,
+            # which leaves a watch on the old inode
+            watch = _FileWatch.open(env_file) if env_file.exists() else None
             try:
-                await asyncio.sleep(30)  # Check every 30 seconds
+                if watch:
+                    await watch.wait()
+                else:
+                    await asyncio.sleep(_ENV_POLL_SECONDS)
 
                 if not env_file.exists():
                     continue
@@ -481,6 +961,9 @@ class AutoUpdater:
             except Exception as e:
                 logger.error(f"Error watching .env file: {e}")
                 await asyncio.sleep(60)  # Wait before retrying
+            finally:
+                if watch:
+                    watch.close()
 
     async def start_background_task(self):
         """Start background task that runs daily updates."""
@@ -491,11 +974,12 @@ class AutoUpdater:
 
         while True:
             try:
-                # 1. Check for git updates
-                git_updates = await self.check_git_updates()
-
-                # 2. Run daily vulnerability/package update check
-                await self.run_daily_update_check()
+                # 1-2. Check for git updates and run the daily vulnerability/package
+                # check together — both are mostly waiting on the network
+                git_updates, _ = await asyncio.gather(
+                    self.check_git_updates(),
+                    self.run_daily_update_check(),
+                )
 
                 # 3. If git updates were pulled, restart to apply them
                 if git_updates and self.auto_restart:
@@ -508,9 +992,13 @@ class AutoUpdater:
                     await self._restart_agent()
                     break  # Exit loop since we're restarting
 
-                # Wait 24 hours
-                logger.info("Next auto-update check in 24 hours")
-                await asyncio.sleep(86400)  # 24 hours
+                # Don't leave this cycle's notifications waiting on the timer
+                await self._flush_now()
+
+                # Wait for the next daily check, aligned to the wall clock
+                next_check = next_daily(self.check_hour)
+                logger.info(f"Next auto-update check at {next_check:%Y-%m-%d %H:%M %Z}")
+                await sleep_until(next_check)
 
             except asyncio.CancelledError:
                 logger.info("Auto-update task cancelled")
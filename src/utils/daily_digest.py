@@ -7,17 +7,178 @@ Runs as a background asyncio task (like ReminderScheduler) and sends a
 Telegram digest at a configurable time each day (default 9 AM PST).
 """
 
-import asyncio
 import json
 import logging
 import os
 import re
+import time
 from datetime import datetime, timedelta
+from functools import lru_cache
 from pathlib import Path
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, Tuple
+
+from .scheduling import next_daily, sleep_until
 
 logger = logging.getLogger(__name__)
 
+_STAT_KEYS = ("messages", "tasks_completed", "tool_calls", "errors_in_tasks")
+
+# Timestamp hour + first counted event on a log line, in one pass (bytes, multiline)
+_LOG_RE = re.compile(
+    rb"^(?P<hour>\d{4}-\d{2}-\d{2} \d{2}):\d{2}:\d{2}.*?"
+    rb"(?P<evt>Executing tool:|Starting autonomous execution|Task completed \(end_turn\)|Error in iteration)",
+    re.MULTILINE,
+)
+_EVT_TO_KEY = {
+    b"Starting autonomous execution": "messages",
+    b"Task completed (end_turn)": "tasks_completed",
+    b"Executing tool:": "tool_calls",
+    b"Error in iteration": "errors_in_tasks",
+}
+# Log line timestamp prefix, for the Aho–Corasick path (matched per hit, not per line)
+_TS_PREFIX_RE = re.compile(r"\d{4}-\d{2}-\d{2} \d{2}:\d{2}:\d{2}")
+_READ_BLOCK_SIZE = 1 << 20  # Log scan reads this many bytes per os.read()
+# Hourly activity buckets older than this are dropped from the offset and counter files
+_BUCKET_RETENTION_HOURS = 7 * 24
+
+
+@lru_cache(maxsize=1)
+def _get_automaton():
+    """Aho–Corasick automaton over the counted events, or None without pyahocorasick."""
+    try:
+        import ahocorasick
+    except ImportError:
+        return None
+    automaton = ahocorasick.Automaton()
+    for evt, key in _EVT_TO_KEY.items():
+        automaton.add_word(evt.decode(), key)
+    automaton.make_automaton()
+    return automaton
+
+
+def _iter_events(buf: bytearray, end: int):
+    """Yield (raw "YYYY-MM-DD HH" bytes, stat key) for each counted line in buf[:end].
+
+    With pyahocorasick installed, all event strings are found in one pass
+    over the block and only lines with a hit are checked for a timestamp;
+    otherwise the combined regex does the same work.
+    """
+    automaton = _get_automaton()
+    if automaton is None:
+        for raw_hour, evt in _LOG_RE.findall(buf, 0, end):
+            yield raw_hour, _EVT_TO_KEY[evt]
+        return
+
+    text = buf[:end].decode("latin-1")  # One char per byte, so offsets line up
+    counted_line = -1
+    for idx, key in automaton.iter(text):
+        line_start = text.rfind("\n", 0, idx) + 1
+        if line_start == counted_line:
+            continue  # Only the first event on a line counts
+        counted_line = line_start
+        if _TS_PREFIX_RE.match(text, line_start):
+            yield bytes(buf[line_start:line_start + 13]), key
+
+
+# Same events matched in already-formatted log messages (no timestamp prefix)
+_EVT_RE = re.compile("|".join(re.escape(evt.decode()) for evt in _EVT_TO_KEY))
+_EVT_STR_TO_KEY = {evt.decode(): key for evt, key in _EVT_TO_KEY.items()}
+_COUNTER_FLUSH_SECONDS = 60
+
+_activity_counter: Optional["ActivityCounterHandler"] = None
+
+
+class ActivityCounterHandler(logging.Handler):
+    """Counts digest events as they are logged, in hourly buckets.
+
+    Lets the digest sum a day of buckets instead of rescanning agent.log.
+    Buckets survive restarts via a JSON sidecar written at most once a
+    minute; `since` records when counting began so a cold start falls
+    back to the log scan until a full window has been counted.
+    """
+
+    def __init__(self, path: Path):
+        super().__init__(level=logging.INFO)
+        self.path = Path(path)
+        self.since: Optional[float] = None  # epoch seconds
+        self.buckets: Dict[str, Dict[str, int]] = {}
+        try:
+            with open(self.path, 'r') as f:
+                state = json.load(f)
+            self.since = float(state["since"])
+            self.buckets = state["buckets"]
+        except (OSError, ValueError, KeyError, TypeError):
+            pass
+        if self.since is None:
+            self.since = time.time()
+        self._dirty = False
+        self._last_flush = time.monotonic()
+
+    def emit(self, record: logging.LogRecord):
+        try:
+            m = _EVT_RE.search(record.getMessage())
+            if m:
+                # Same local-time hour key as the log's asctime
+                hour = time.strftime("%Y-%m-%d %H", time.localtime(record.created))
+                bucket = self.buckets.setdefault(hour, dict.fromkeys(_STAT_KEYS, 0))
+                bucket[_EVT_STR_TO_KEY[m.group()]] += 1
+                self._dirty = True
+            if self._dirty and time.monotonic() - self._last_flush >= _COUNTER_FLUSH_SECONDS:
+                self.flush()
+        except Exception:
+            self.handleError(record)
+
+    def flush(self):
+        """Persist buckets to the sidecar file (atomic replace)."""
+        with self.lock:
+            if not self._dirty:
+                return
+            oldest = time.strftime(
+                "%Y-%m-%d %H", time.localtime(time.time() - _BUCKET_RETENTION_HOURS * 3600)
+            )
+            for hour in [h for h in self.buckets if h < oldest]:
+                del self.buckets[hour]
+            try:
+                tmp = self.path.with_suffix(".tmp")
+                with open(tmp, 'w') as f:
+                    json.dump({"since": self.since, "buckets": self.buckets}, f, separators=(",", ":"))
+                os.replace(tmp, self.path)
+                self._dirty = False
+            except OSError:
+                pass  # Retried on the next flush; logging here would recurse
+            self._last_flush = time.monotonic()
+
+    def close(self):
+        self.flush()
+        super().close()
+
+    def counts_since(self, cutoff: datetime) -> Optional[Dict[str, int]]:
+        """Sum buckets from cutoff's hour on.
+
+        Returns:
+            Dict of counts, or None if counting started after the cutoff
+        """
+        cutoff_ts = cutoff.timestamp()
+        if self.since is None or self.since > cutoff_ts:
+            return None
+        cutoff_hour = time.strftime("%Y-%m-%d %H", time.localtime(cutoff_ts))
+        stats = dict.fromkeys(_STAT_KEYS, 0)
+        with self.lock:
+            for hour, counts in self.buckets.items():
+                if hour >= cutoff_hour:
+                    for key in _STAT_KEYS:
+                        stats[key] += counts.get(key, 0)
+        return stats
+
+
+def install_activity_counter(data_dir: str = "./data") -> ActivityCounterHandler:
+    """Attach an ActivityCounterHandler to the root logger (call once at startup)."""
+    global _activity_counter
+    handler = ActivityCounterHandler(Path(data_dir) / "activity_counters.json")
+    logging.getLogger().addHandler(handler)
+    _activity_counter = handler
+    return handler
+
 
 class DailyDigest:
     """Generates and sends daily activity reports via Telegram."""
@@ -45,43 +206,32 @@ class DailyDigest:
         self.monitor = self_healing_monitor
         self.log_file = Path(log_file)
         self.data_dir = Path(data_dir)
+        self.offset_file = self.data_dir / "digest_offset.json"
         self.digest_hour = digest_hour
         self.digest_minute = digest_minute
-        self._last_digest_date = None
+        # ((errors detected, fixes attempted), fixer summary) from the last report
+        self._fix_summary_cache: Optional[Tuple[Tuple[int, int], Dict[str, Any]]] = None
 
         logger.info(f"DailyDigest initialized (scheduled at {digest_hour:02d}:{digest_minute:02d})")
 
     async def start(self):
-        """Background loop — check every 60s if it's time to send the digest."""
+        """Background loop — sleep until the scheduled time, then send the digest."""
         logger.info("📊 Daily digest scheduler started")
         while True:
+            next_digest = next_daily(self.digest_hour, self.digest_minute)
+            logger.info(f"Next daily digest at {next_digest:%Y-%m-%d %H:%M %Z}")
+            await sleep_until(next_digest)
             try:
-                await self._check_and_send()
+                await self._send_digest()
             except Exception as e:
                 logger.error(f"Daily digest error: {e}", exc_info=True)
-            await asyncio.sleep(60)
 
-    async def _check_and_send(self):
-        """Check if it's time to send the daily digest."""
-        try:
-            from ..core.timezone import USER_TZ
-            now = datetime.now(USER_TZ)
-        except ImportError:
-            now = datetime.now()
-
-        today = now.date()
-
-        # Already sent today?
-        if self._last_digest_date == today:
-            return
-
-        # Is it time?
-        if now.hour == self.digest_hour and now.minute >= self.digest_minute:
-            logger.info("📊 Sending daily digest...")
-            report = await self.generate_report(hours=24)
-            await self.telegram.notify(report, level="info")
-            self._last_digest_date = today
-            logger.info("📊 Daily digest sent")
+    async def _send_digest(self):
+        """Generate the last 24h report and send it."""
+        logger.info("📊 Sending daily digest...")
+        report = await self.generate_report(hours=24)
+        await self.telegram.notify(report, level="info")
+        logger.info("📊 Daily digest sent")
 
     async def generate_report(self, hours: int = 24) -> str:
         """Generate the activity report.
@@ -147,52 +297,119 @@ class DailyDigest:
         - Tool calls (Executing tool:)
         - Errors in tasks
 
+        Uses the in-process ActivityCounterHandler when it has been counting
+        since before the cutoff. Otherwise scans the log, reading only bytes
+        appended since the previous call: counts are kept in hourly buckets
+        persisted with the file offset in data/digest_offset.json, and reset
+        when the log is rotated.
+
         Args:
-            cutoff: Count activity after this time
+            cutoff: Count activity after this time (hour granularity)
 
         Returns:
             Dict of counts
         """
-        stats = {
-            "messages": 0,
-            "tasks_completed": 0,
-            "tool_calls": 0,
-            "errors_in_tasks": 0
-        }
+        if _activity_counter is not None:
+            counted = _activity_counter.counts_since(cutoff)
+            if counted is not None:
+                return counted
+
+        stats = dict.fromkeys(_STAT_KEYS, 0)
 
         if not self.log_file.exists():
             return stats
 
+        state = self._load_offset_state()
+        buckets: Dict[str, Dict[str, int]] = state["buckets"]
+
         try:
-            with open(self.log_file, 'r') as f:
-                for line in f:
-                    # Check timestamp
-                    ts_match = re.search(r"(\d{4}-\d{2}-\d{2} \d{2}:\d{2}:\d{2})", line)
-                    if ts_match:
-                        try:
-                            line_time = datetime.fromisoformat(ts_match.group(1))
-                            # Make naive comparison work
-                            cutoff_naive = cutoff.replace(tzinfo=None) if cutoff.tzinfo else cutoff
-                            if line_time < cutoff_naive:
-                                continue
-                        except ValueError:
-                            continue
-
-                    # Count patterns
-                    if "Starting autonomous execution" in line:
-                        stats["messages"] += 1
-                    elif "Task completed (end_turn)" in line:
-                        stats["tasks_completed"] += 1
-                    elif "Executing tool:" in line:
-                        stats["tool_calls"] += 1
-                    elif "Error in iteration" in line:
-                        stats["errors_in_tasks"] += 1
+            st = self.log_file.stat()
+            offset = state["offset"]
+            if st.st_ino != state["inode"] or st.st_size < offset:
+                # Log rotated or truncated — start over from the beginning
+                offset = 0
+                buckets.clear()
+
+            if st.st_size > offset:
+                offset = self._scan_log_from(offset, buckets)
+
+            # Drop buckets past the retention window
+            cutoff_naive = cutoff.replace(tzinfo=None) if cutoff.tzinfo else cutoff
+            oldest = (cutoff_naive - timedelta(hours=_BUCKET_RETENTION_HOURS)).strftime("%Y-%m-%d %H")
+            for hour in [h for h in buckets if h < oldest]:
+                del buckets[hour]
+
+            self._save_offset_state({
+                "inode": st.st_ino,
+                "offset": offset,
+                "buckets": buckets,
+            })
+
+            cutoff_hour = cutoff_naive.strftime("%Y-%m-%d %H")
+            for hour, counts in buckets.items():
+                if hour >= cutoff_hour:
+                    for key in _STAT_KEYS:
+                        stats[key] += counts.get(key, 0)
 
         except Exception as e:
             logger.error(f"Error reading log for digest: {e}")
 
         return stats
 
+    def _scan_log_from(self, offset: int, buckets: Dict[str, Dict[str, int]]) -> int:
+        """Bucket counted events in the log from `offset`, reading raw 1 MiB blocks.
+
+        Only complete lines are consumed; a trailing partial line is left for
+        the next call.
+
+        Returns:
+            Offset just past the last complete line scanned
+        """
+        fd = os.open(self.log_file, os.O_RDONLY)
+        try:
+            os.lseek(fd, offset, os.SEEK_SET)
+            buf = bytearray()
+            # Raw hour bytes -> bucket, so each match costs one dict lookup
+            # and each distinct hour is decoded once
+            by_raw_hour: Dict[bytes, Dict[str, int]] = {}
+            while chunk := os.read(fd, _READ_BLOCK_SIZE):
+                buf += chunk
+                end = buf.rfind(b"\n") + 1
+                if not end:
+                    continue
+                for raw_hour, key in _iter_events(buf, end):
+                    bucket = by_raw_hour.get(raw_hour)
+                    if bucket is None:
+                        # "YYYY-MM-DD HH" — sorts chronologically
+                        bucket = buckets.setdefault(raw_hour.decode(), dict.fromkeys(_STAT_KEYS, 0))
+                        by_raw_hour[raw_hour] = bucket
+                    bucket[key] += 1
+                offset += end
+                del buf[:end]
+        finally:
+            os.close(fd)
+        return offset
+
+    def _load_offset_state(self) -> Dict[str, Any]:
+        """Load the persisted log offset + hourly buckets (fresh state if missing)."""
+        state = {"inode": None, "offset": 0, "buckets": {}}
+        try:
+            with open(self.offset_file, 'r') as f:
+                state.update(json.load(f))
+        except (OSError, ValueError):
+            pass
+        return state
+
+    def _save_offset_state(self, state: Dict[str, Any]):
+        """Persist the log offset + hourly buckets."""
+        try:
+            tmp = self.offset_file.with_suffix(".tmp")
+            with open(tmp, 'w') as f:
+                json.dump(state, f, separators=(",", ":"))
+            os.replace(tmp, self.offset_file)
+        except OSError as e:
+            logger.error(f"Error saving digest offset: {e}")
+
     def _get_capability_summary(self) -> Optional[str]:
         """Get capability backlog summary from the interceptor's backlog file.
 
@@ -279,7 +496,13 @@ class DailyDigest:
             parts = ["🩺 **Self-Healing:**"]
             parts.append(f"  Errors detected: {total_errors}")
             if total_fixes > 0:
-                fix_summary = self.monitor.fixer.get_fix_summary()
+                # The fix history only changes when these counters move
+                key = (total_errors, total_fixes)
+                if self._fix_summary_cache and self._fix_summary_cache[0] == key:
+                    fix_summary = self._fix_summary_cache[1]
+                else:
+                    fix_summary = self.monitor.fixer.get_fix_summary()
+                    self._fix_summary_cache = (key, fix_summary)
                 successful = fix_summary.get("successful_count", 0)
                 parts.append(f"  Auto-fixed: {successful}/{total_fixes}")
 
@@ -12,6 +12,8 @@ import secrets
 from datetime import datetime, timedelta
 from typing import Dict, Any, List, Optional
 
+import orjson
+
 logger = logging.getLogger(__name__)
 
 # HTTP paths exempt from auth (webhooks must be reachable without login)
@@ -550,7 +552,9 @@ class Dashboard:
             """Pull latest code from git. Guides in data/guides/ are preserved."""
             import subprocess
             try:
-                result = subprocess.run(
+                # In a thread: this loop also serves the Telegram webhook
+                result = await asyncio.to_thread(
+                    subprocess.run,
                     ["git", "pull", "--ff-only"],
                     capture_output=True, text=True, timeout=30,
                     cwd=str(_P(".").resolve())
@@ -704,10 +708,12 @@ class Dashboard:
                 return {"ok": False, "error": "Chat handler not configured"}
 
             try:
-                update_data = await request.json()
-                logger.debug(f"Received Telegram webhook: {update_data}")
-                result = await self.telegram_chat.handle_webhook(update_data)
-                return result
+                # Raw body; the channel decodes it with orjson straight into its
+                # update type (Request.json() would use stdlib json)
+                update_body = await request.body()
+                logger.debug("Received Telegram webhook: %s", update_body)
+                result = await self.telegram_chat.handle_webhook(update_body)
+                return FR(content=orjson.dumps(result), media_type="application/json")
             except Exception as e:
                 logger.error(f"Error in Telegram webhook: {e}", exc_info=True)
                 return {"ok": False, "error": str(e)}
@@ -0,0 +1,45 @@
+"""Extract JSON from LLM output.
+
+Models often wrap JSON in markdown fences or add a sentence before/after
+it. Instead of stripping fences by hand (or regex-matching braces, which
+breaks on nested objects), scan to the first '{' or '[' and let the JSON
+decoder consume exactly one value from there. Clean replies (the common
+case) are parsed by orjson directly.
+"""
+
+import json
+from typing import Any
+
+import orjson
+
+_DECODER = json.JSONDecoder()
+
+
+def parse_llm_json(text: str) -> Any:
+    """Decode the first JSON object or array in LLM output.
+
+    Args:
+        text: Raw model output (may include fences or surrounding prose)
+
+    Returns:
+        The decoded value
+
+    Raises:
+        json.JSONDecodeError: If no JSON object or array can be decoded
+    """
+    try:
+        value = orjson.loads(text)
+        if isinstance(value, (dict, list)):
+            return value
+    except orjson.JSONDecodeError:
+        pass
+    starts = sorted(i for i in (text.find("{"), text.find("[")) if i != -1)
+    if not starts:
+        raise json.JSONDecodeError("No JSON object or array found", text, 0)
+    error = None
+    for start in starts:
+        try:
+            return _DECODER.raw_decode(text, start)[0]
+        except json.JSONDecodeError as e:
+            error = e
+    raise error
@@ -71,7 +71,7 @@ class MemoryBackup:
         try:
             # CREATE: copy source to dated destination (read-only on source)
             self.backup_root.mkdir(parents=True, exist_ok=True)
-            await asyncio.get_event_loop().run_in_executor(
+            await asyncio.get_running_loop().run_in_executor(
                 None, lambda: shutil.copytree(str(self.source), str(dest))
             )
             logger.info(f"✅ Memory backup created: {dest.name}")
@@ -90,7 +90,7 @@ class MemoryBackup:
                     date_part = entry.name.replace("digital_clone_brain_", "")[:8]
                     entry_date = datetime.strptime(date_part, "%Y%m%d")
                     if entry_date < cutoff:
-                        await asyncio.get_event_loop().run_in_executor(
+                        await asyncio.get_running_loop().run_in_executor(
                             None, lambda e=entry: shutil.rmtree(str(e))
                         )
                         purged.append(entry.name)
@@ -0,0 +1,120 @@
+"""Client-side rate limiters.
+
+`SlidingWindow` (requests + tokens per minute) throttles before a request
+is sent so the first burst after startup doesn't run into provider 429s.
+Each model gets its own window, sized from one default (overridable via
+ANTHROPIC_RPM / ANTHROPIC_TPM) and shared across callers via
+`get_window(model)`.
+
+`TokenBucket` smooths bursts against a fixed per-second limit (e.g. the
+Telegram Bot API's ~30 msg/s).
+"""
+
+import asyncio
+import logging
+import os
+import time
+from collections import deque
+from typing import Dict, Tuple
+
+logger = logging.getLogger(__name__)
+
+_WINDOW_SECONDS = 60.0
+
+# Approximate Anthropic tier-2 limits (rpm, tpm), applied per model.
+# Override with ANTHROPIC_RPM / ANTHROPIC_TPM for other tiers.
+_DEFAULT_LIMITS: Tuple[int, int] = (1000, 450_000)
+
+_windows: Dict[str, "SlidingWindow"] = {}
+
+
+class SlidingWindow:
+    """Requests-per-minute and tokens-per-minute limiter over a 60s window."""
+
+    def __init__(self, rpm: int, tpm: int):
+        """Initialize the window.
+
+        Args:
+            rpm: Max requests per rolling minute
+            tpm: Max (estimated) tokens per rolling minute
+        """
+        self.rpm = rpm
+        self.tpm = tpm
+        self._requests: deque = deque()  # request timestamps
+        self._tokens: deque = deque()    # (timestamp, tokens)
+        self._token_sum = 0
+
+    def _expire(self, now: float):
+        cutoff = now - _WINDOW_SECONDS
+        while self._requests and self._requests[0] <= cutoff:
+            self._requests.popleft()
+        while self._tokens and self._tokens[0][0] <= cutoff:
+            self._token_sum -= self._tokens.popleft()[1]
+
+    async def wait_if_throttled(self, est_tokens: int = 0):
+        """Sleep until the request fits in the window, then record it.
+
+        Args:
+            est_tokens: Estimated tokens the request will consume
+        """
+        # A single request larger than the budget can never fit; clamp it
+        est_tokens = min(est_tokens, self.tpm)
+        while True:
+            now = time.monotonic()
+            self._expire(now)
+            over_rpm = len(self._requests) >= self.rpm
+            over_tpm = self._token_sum + est_tokens > self.tpm
+            if not over_rpm and not over_tpm:
+                self._requests.append(now)
+                self._tokens.append((now, est_tokens))
+                self._token_sum += est_tokens
+                return
+            oldest = self._requests[0] if over_rpm else self._tokens[0][0]
+            delay = max(0.0, oldest + _WINDOW_SECONDS - now)
+            logger.info(f"Client-side rate limit reached, waiting {delay:.1f}s")
+            await asyncio.sleep(delay)
+
+
+class TokenBucket:
+    """Token-bucket limiter: sustained `rate` per second, bursts up to `burst`."""
+
+    def __init__(self, rate: float, burst: int):
+        """Initialize the bucket (starts full).
+
+        Args:
+            rate: Tokens added per second
+            burst: Bucket capacity
+        """
+        self.rate = rate
+        self.burst = burst
+        self._tokens = float(burst)
+        self._updated = time.monotonic()
+        self._lock = asyncio.Lock()  # Waiters are served in arrival order
+
+    async def acquire(self):
+        """Sleep until a token is available, then take it."""
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+                self._updated = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                await asyncio.sleep((1 - self._tokens) / self.rate)
+
+
+def _limits() -> Tuple[int, int]:
+    rpm, tpm = _DEFAULT_LIMITS
+    rpm = int(os.getenv("ANTHROPIC_RPM", rpm))
+    tpm = int(os.getenv("ANTHROPIC_TPM", tpm))
+    return rpm, tpm
+
+
+def get_window(model: str) -> SlidingWindow:
+    """Return the shared window for a model (each model has its own limits)."""
+    window = _windows.get(model)
+    if window is None:
+        window = SlidingWindow(*_limits())
+        _windows[model] = window
+    return window
@@ -0,0 +1,49 @@
+"""Wall-clock scheduling helpers for long-running background tasks.
+
+`asyncio.sleep(86400)` drifts: each cycle starts a day after the previous
+one *finished*, and the monotonic clock doesn't advance while the host is
+suspended. These helpers target a wall-clock time instead.
+"""
+
+import asyncio
+import time
+from datetime import datetime, timedelta, tzinfo
+from typing import Optional
+
+from ..core.timezone import USER_TZ
+
+# Re-check the wall clock at least this often while waiting, so suspend/resume
+# or clock corrections don't push the target back by hours
+_MAX_SLEEP_STEP = 3600.0
+
+
+def next_daily(hour: int, minute: int = 0, tz: Optional[tzinfo] = None) -> datetime:
+    """Return the next occurrence of hour:minute in `tz` (strictly in the future).
+
+    Args:
+        hour: Hour of day (0-23)
+        minute: Minute of hour
+        tz: Timezone for the wall-clock time (defaults to USER_TZ)
+
+    Returns:
+        Timezone-aware datetime of the next occurrence
+    """
+    if tz is None:
+        tz = USER_TZ
+    now = datetime.now(tz)
+    target = now.replace(hour=hour, minute=minute, second=0, microsecond=0)
+    if target <= now:
+        # zoneinfo arithmetic is wall-clock, so this stays at hour:minute across DST
+        target += timedelta(days=1)
+    return target
+
+
+async def sleep_until(when: datetime):
+    """Sleep until the wall clock reaches `when` (a timezone-aware datetime)."""
+    while True:
+        # Aware datetimes sharing a tzinfo subtract as wall-clock times, which is
+        # off by the DST shift across a transition; compare absolute instants
+        remaining = when.timestamp() - time.time()
+        if remaining <= 0:
+            return
+        await asyncio.sleep(min(remaining, _MAX_SLEEP_STEP))
@@ -2,11 +2,44 @@
 
 import asyncio
 import logging
-from typing import Optional, Callable
+from typing import Optional, Callable, Tuple
 from datetime import datetime
 
+try:
+    import telegram
+    from telegram.error import RetryAfter
+    from telegram.request import HTTPXRequest
+except ImportError:  # Optional: notifications are disabled without it
+    telegram = None
+
+from .ratelimit import TokenBucket
+
 logger = logging.getLogger(__name__)
 
+_CONNECTION_POOL_SIZE = 8  # Concurrent sends beyond this wait for a free connection
+
+# Outbox: callers enqueue and return; one worker sends at Telegram's
+# per-chat pace (~1 msg/s, short bursts allowed) and honors 429 retry_after
+_OUTBOX_SIZE = 100  # Oldest queued notification is dropped beyond this
+_CHAT_SEND_RATE = 1
+_CHAT_SEND_BURST = 3
+_MAX_RETRY_AFTER = 60
+_FLUSH_TIMEOUT = 10
+
+
+def _build_request():
+    """One pooled HTTPX client shared by every send; HTTP/2 when h2 is installed."""
+    try:
+        import h2  # noqa: F401
+        http_version = "2"
+    except ImportError:
+        http_version = "1.1"
+    return HTTPXRequest(
+        connection_pool_size=_CONNECTION_POOL_SIZE,
+        read_timeout=10,
+        http_version=http_version,
+    )
+
 
 class TelegramNotifier:
     """Send notifications and handle commands via Telegram."""
@@ -21,21 +54,24 @@ class TelegramNotifier:
         self.bot_token = bot_token
         self.chat_id = chat_id
         self.enabled = bool(bot_token and chat_id)
+        self._outbox: asyncio.Queue = asyncio.Queue(maxsize=_OUTBOX_SIZE)
+        self._outbox_task: Optional[asyncio.Task] = None
+        self._limiter = TokenBucket(rate=_CHAT_SEND_RATE, burst=_CHAT_SEND_BURST)
 
         if self.enabled:
-            # Import telegram only if enabled
-            try:
-                import telegram
-                self.bot = telegram.Bot(token=bot_token)
+            if telegram is not None:
+                self.bot = telegram.Bot(token=bot_token, request=_build_request())
                 logger.info("Telegram bot initialized")
-            except ImportError:
+            else:
                 logger.warning("python-telegram-bot not installed. Install with: pip install python-telegram-bot")
                 self.enabled = False
         else:
             logger.info("Telegram notifications disabled (no token/chat_id)")
 
     async def notify(self, message: str, level: str = "info"):
-        """Send notification to Telegram.
+        """Queue a notification for Telegram.
+
+        Returns immediately; the outbox worker delivers it.
 
         Args:
             message: Message to send
@@ -44,38 +80,73 @@ class TelegramNotifier:
         if not self.enabled:
             return
 
-        try:
-            # Add emoji based on level
-            emoji = {
-                "info": "ℹ️",
-                "success": "✅",
-                "error": "❌",
-                "warning": "⚠️",
-                "progress": "📊"
-            }
-
-            formatted_message = f"{emoji.get(level, 'ℹ️')} {message}"
-
-            # Send message
-            await self.bot.send_message(
-                chat_id=self.chat_id,
-                text=formatted_message,
-                parse_mode="Markdown"
-            )
-
-            logger.debug(f"Sent Telegram notification: {level}")
-
-        except Exception as e:
-            logger.warning(f"Failed to send Telegram notification (Markdown): {e}")
+        # Add emoji based on level
+        emoji = {
+            "info": "ℹ️",
+            "success": "✅",
+            "error": "❌",
+            "warning": "⚠️",
+            "progress": "📊"
+        }
+
+        self._enqueue(f"{emoji.get(level, 'ℹ️')} {message}", "Markdown")
+        logger.debug(f"Queued Telegram notification: {level}")
+
+    def _enqueue(self, text: str, parse_mode: Optional[str]):
+        """Add a message to the outbox, starting the worker if needed."""
+        if self._outbox.full():
+            self._outbox.get_nowait()
+            self._outbox.task_done()
+            logger.warning("Telegram outbox full, dropped oldest notification")
+        self._outbox.put_nowait((text, parse_mode))
+
+        if self._outbox_task is None or self._outbox_task.done():
+            self._outbox_task = asyncio.create_task(self._outbox_worker())
+
+    async def _outbox_worker(self):
+        """Send queued messages one at a time, paced per chat."""
+        while True:
+            item: Tuple[str, Optional[str]] = await self._outbox.get()
+            try:
+                await self._deliver(*item)
+            finally:
+                self._outbox.task_done()
+
+    async def _deliver(self, text: str, parse_mode: Optional[str]):
+        """Send one message; retry after a 429, fall back to plain text on Markdown errors."""
+        while True:
+            await self._limiter.acquire()
             try:
-                # Fallback to plain text
                 await self.bot.send_message(
                     chat_id=self.chat_id,
-                    text=formatted_message,
-                    parse_mode=None
+                    text=text,
+                    parse_mode=parse_mode
                 )
-            except Exception as e2:
-                logger.error(f"Failed to send Telegram notification (Plain Text): {e2}")
+                return
+            except RetryAfter as e:
+                # int seconds, or a timedelta on newer python-telegram-bot
+                retry_after = e.retry_after
+                if hasattr(retry_after, "total_seconds"):
+                    retry_after = retry_after.total_seconds()
+                delay = min(float(retry_after), _MAX_RETRY_AFTER)
+                logger.warning(f"Telegram rate limited, retrying in {delay:.0f}s")
+                await asyncio.sleep(delay)
+            except Exception as e:
+                if parse_mode is None:
+                    logger.error(f"Failed to send Telegram notification (Plain Text): {e}")
+                    return
+                logger.warning(f"Failed to send Telegram notification (Markdown): {e}")
+                # Fallback to plain text
+                parse_mode = None
+
+    async def flush(self, timeout: float = _FLUSH_TIMEOUT):
+        """Wait (up to timeout seconds) for queued notifications to be sent."""
+        if self._outbox_task is None:
+            return
+        try:
+            await asyncio.wait_for(self._outbox.join(), timeout)
+        except asyncio.TimeoutError:
+            logger.warning(f"Telegram outbox not drained ({self._outbox.qsize()} pending)")
 
     async def send_progress(
         self,
@@ -111,11 +182,7 @@ Progress: {current}/{total} ({progress_pct}%)
             if details:
                 message += f"\n{details}"
 
-            await self.bot.send_message(
-                chat_id=self.chat_id,
-                text=message,
-                parse_mode="Markdown"
-            )
+            self._enqueue(message, "Markdown")
 
         except Exception as e:
             logger.error(f"Failed to send progress: {e}")
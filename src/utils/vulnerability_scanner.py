@@ -48,7 +48,7 @@ class VulnerabilityScanner:
             import subprocess
             # Run pip-audit directly via subprocess (avoids bash tool security filters)
             try:
-                proc = await asyncio.get_event_loop().run_in_executor(
+                proc = await asyncio.get_running_loop().run_in_executor(
                     None,
                     lambda: subprocess.run(
                         ["pip-audit", "--format", "json", "--desc", "on"],
@@ -59,7 +59,7 @@ class VulnerabilityScanner:
                     vulnerabilities.extend(self._parse_pip_audit(proc.stdout))
                 else:
                     logger.info("pip-audit not available, trying safety...")
-                    proc = await asyncio.get_event_loop().run_in_executor(
+                    proc = await asyncio.get_running_loop().run_in_executor(
                         None,
                         lambda: subprocess.run(
                             ["safety", "check", "--json"],
@@ -109,7 +109,7 @@ class VulnerabilityScanner:
                 logger.info("No supported package manager found — skipping system scan")
                 return updates
 
-            proc = await asyncio.get_event_loop().run_in_executor(
+            proc = await asyncio.get_running_loop().run_in_executor(
                 None,
                 lambda: subprocess.run(cmd, capture_output=True, text=True, timeout=120)
             )
@@ -315,8 +315,9 @@ class ServiceWatchdog:
 
         try:
             # Lazy import to avoid crash if these modules are broken
-            # We need to add src to sys.path first
-            sys.path.insert(0, str(self.project_root))
+            # We need to add src to sys.path first (once — this runs per crash)
+            if str(self.project_root) not in sys.path:
+                sys.path.insert(0, str(self.project_root))
             
             from src.core.self_healing.auto_fixer import AutoFixer
             from src.core.self_healing.error_detector import DetectedError, ErrorType, ErrorSeverity